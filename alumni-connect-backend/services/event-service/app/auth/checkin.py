@@ -0,0 +1,46 @@
+import base64
+import hashlib
+import hmac
+import os
+from typing import Optional, Tuple
+from dotenv import load_dotenv
+from app.auth.jwt import JWT_SECRET
+
+load_dotenv()
+
+# Check-in tokens are printed as QR codes, so they are a compact HMAC over the
+# registration instead of a JWT. Door staff can verify them without a DB lookup.
+# Without a dedicated secret the key is derived from JWT_SECRET under a fixed
+# label, so the raw JWT signing key is never used for a second purpose.
+CHECKIN_TOKEN_LABEL = b"alumni-connect checkin token"
+
+def _checkin_key() -> bytes:
+    secret = os.getenv("CHECKIN_TOKEN_SECRET")
+    if secret:
+        return secret.encode()
+    return hmac.new(JWT_SECRET.encode(), CHECKIN_TOKEN_LABEL, hashlib.sha256).digest()
+
+CHECKIN_TOKEN_KEY = _checkin_key()
+SIGNATURE_LENGTH = 22  # 132 bits of the base64url-encoded SHA-256 MAC
+
+def _signature(registration_id: str, event_id: str) -> str:
+    mac = hmac.new(
+        CHECKIN_TOKEN_KEY,
+        f"{registration_id}.{event_id}".encode(),
+        hashlib.sha256
+    ).digest()
+    return base64.urlsafe_b64encode(mac).decode()[:SIGNATURE_LENGTH]
+
+def sign_checkin_token(registration_id: str, event_id: str) -> str:
+    """Token that proves a registration for an event: <registrationId>.<eventId>.<signature>"""
+    return f"{registration_id}.{event_id}.{_signature(registration_id, event_id)}"
+
+def verify_checkin_token(token: str) -> Optional[Tuple[str, str]]:
+    """Return (registration_id, event_id) for a genuine token, None otherwise"""
+    parts = token.strip().split(".")
+    if len(parts) != 3 or not all(parts):
+        return None
+    registration_id, event_id, signature = parts
+    if not hmac.compare_digest(signature, _signature(registration_id, event_id)):
+        return None
+    return registration_id, event_id
@@ -1,20 +1,37 @@
 from jose import jwt, JWTError
 from typing import Optional
+import hashlib
+import logging
 import os
+import time
 from dotenv import load_dotenv
+from app.cache.ttl_cache import TTLCache
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 JWT_SECRET = os.getenv("JWT_SECRET", "your-super-secret-jwt-key-change-this-in-production")
 ALGORITHM = "HS256"
 
-def verify_token(token: str) -> Optional[dict]:
-    """Verify JWT token and return user data"""
+# Verified tokens are cached until their exp claim (capped at the max TTL),
+# failed ones only briefly so a fixed-up client isn't locked out
+JWT_CACHE_MAX_TTL = float(os.getenv("JWT_CACHE_MAX_TTL", 3600))
+JWT_CACHE_FAILURE_TTL = float(os.getenv("JWT_CACHE_FAILURE_TTL", 10))
+
+token_cache = TTLCache(
+    maxsize=int(os.getenv("JWT_CACHE_SIZE", 10000)),
+    ttl=JWT_CACHE_MAX_TTL
+)
+
+_INVALID = object()
+
+def _token_key(token: str) -> str:
+    # Hash so raw tokens are never held as cache keys
+    return hashlib.sha256(token.encode()).hexdigest()
+
+def _decode_token(token: str) -> Optional[dict]:
     try:
-        # Remove 'Bearer ' prefix if present
-        if token.startswith('Bearer '):
-            token = token.replace('Bearer ', '')
-        
         payload = jwt.decode(token, JWT_SECRET, algorithms=[ALGORITHM])
         
         user_data = {
@@ -23,24 +40,46 @@ def verify_token(token: str) -> Optional[dict]:
             'role': payload.get('role')
         }
         
-        print(f"✅ JWT verified successfully for user: {user_data['email']}")
+        exp = payload.get('exp')
+        ttl = JWT_CACHE_MAX_TTL if exp is None else min(float(exp) - time.time(), JWT_CACHE_MAX_TTL)
+        token_cache.set(_token_key(token), user_data, ttl=ttl)
+        
+        logger.debug("JWT verified", extra={"userId": user_data['userId']})
         return user_data
         
     except JWTError as e:
-        print(f"❌ JWT verification failed: {str(e)}")
-        return None
-    except Exception as e:
-        print(f"❌ Token verification error: {str(e)}")
+        logger.info("JWT verification failed: %s", e, extra={"sample": True})
+    except Exception:
+        logger.exception("Token verification error")
+    
+    token_cache.set(_token_key(token), _INVALID, ttl=JWT_CACHE_FAILURE_TTL)
+    return None
+
+def verify_token(token: str) -> Optional[dict]:
+    """Verify JWT token and return user data"""
+    # Remove 'Bearer ' prefix if present
+    if token.startswith('Bearer '):
+        token = token.replace('Bearer ', '')
+    
+    cached = token_cache.get(_token_key(token), None)
+    if cached is _INVALID:
         return None
+    if cached is not None:
+        return dict(cached)
+    
+    user_data = _decode_token(token)
+    return dict(user_data) if user_data else None
+
+def token_cache_stats() -> dict:
+    """Hit/miss counters for the verification cache"""
+    return token_cache.stats()
 
 def get_user_from_token(authorization: Optional[str]) -> Optional[dict]:
     """Extract user from Authorization header"""
     if not authorization:
-        print("⚠️ No authorization header provided")
         return None
     
     if not authorization.startswith("Bearer "):
-        print("⚠️ Authorization header doesn't start with 'Bearer '")
         # Try to verify anyway in case it's just the token
         return verify_token(authorization)
     
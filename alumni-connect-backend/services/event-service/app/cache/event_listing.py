@@ -0,0 +1,69 @@
+import os
+from dataclasses import dataclass
+from typing import FrozenSet, Hashable, Iterable, Optional
+from app.cache.ttl_cache import TTLCache
+
+@dataclass(frozen=True)
+class CachedListing:
+    response: object
+    event_ids: FrozenSet[str]
+    status: Optional[str]
+
+def listing_key(filter) -> Hashable:
+    """Normalize an EventFilterInput into a cache key"""
+    search = " ".join(filter.search.lower().split()) if filter.search else None
+    return (
+        filter.status.value if filter.status else None,
+        search,
+        filter.type.value if filter.type else None,
+        filter.isOnline,
+        filter.organizerId,
+        filter.upcoming,
+        filter.limit,
+        filter.offset,
+        filter.after,
+        filter.totalCount.value,
+        filter.orderBy,
+        filter.order.lower(),
+    )
+
+class EventListingCache:
+    """Response cache for anonymous event listings, invalidated by mutations"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, filter, columns: FrozenSet[str] = frozenset()):
+        """columns: the projected Event columns the cached response was built from"""
+        listing = self._cache.get((listing_key(filter), columns))
+        return listing.response if listing else None
+
+    def set(self, filter, response, event_ids: Iterable[str], columns: FrozenSet[str] = frozenset()) -> None:
+        self._cache.set((listing_key(filter), columns), CachedListing(
+            response=response,
+            event_ids=frozenset(event_ids),
+            status=filter.status.value if filter.status else None
+        ))
+
+    def invalidate_events(self, event_ids: Iterable[str]) -> int:
+        """Drop listings that contain any of these events, e.g. after seat counts changed"""
+        event_ids = set(event_ids)
+        return self._cache.delete_where(lambda _, listing: bool(listing.event_ids & event_ids))
+
+    def invalidate_statuses(self, statuses: Iterable[str]) -> int:
+        """Drop listings an event entering or leaving these statuses could appear in"""
+        statuses = set(statuses)
+        return self._cache.delete_where(
+            lambda _, listing: listing.status is None or listing.status in statuses
+        )
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+event_listing_cache = EventListingCache(
+    maxsize=int(os.getenv("LISTING_CACHE_SIZE", 256)),
+    ttl=float(os.getenv("LISTING_CACHE_TTL", 30))
+)
@@ -1,21 +1,118 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 import os
+import threading
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL)
+def to_async_url(url: str) -> str:
+    """Point a postgres URL at the asyncpg driver"""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+
+def pool_options() -> dict:
+    """Connection pool settings, tunable from the environment"""
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", 5)),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 10)),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", 30)),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+    }
+
+POOL_OPTIONS = pool_options()
+
+class PoolWaitStats:
+    """Track how long checkouts wait for a pooled connection"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            avg = self.total_wait / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "avgWaitMs": round(avg * 1000, 3),
+                "maxWaitMs": round(self.max_wait * 1000, 3),
+            }
+
+pool_wait_stats = PoolWaitStats()
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records checkout wait time"""
+
+    def _do_get(self):
+        start = time.time()
+        try:
+            record = super()._do_get()
+        except Exception:
+            # Timed out (or failed to connect) while waiting
+            pool_wait_stats.record(time.time() - start)
+            raise
+        # A connection opened for this checkout (overflow) records when it
+        # started connecting; time after that is connect latency, not waiting
+        waited_until = record.starttime if record.starttime >= start else time.time()
+        pool_wait_stats.record(waited_until - start)
+        return record
+
+# Sync engine, used by scripts such as seed_events.py
+engine = create_engine(DATABASE_URL, **POOL_OPTIONS)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine, used by the GraphQL resolvers
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass=TimedAsyncAdaptedQueuePool,
+    **POOL_OPTIONS
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 Base = declarative_base()
 
+def pool_status() -> dict:
+    """Live statistics for the async connection pool"""
+    pool = async_engine.pool
+    return {
+        "size": pool.size(),
+        "checkedOut": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(0, pool.overflow()),
+        "maxOverflow": POOL_OPTIONS["max_overflow"],
+        **pool_wait_stats.snapshot(),
+    }
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,24 @@
+from typing import Optional
+from app.graphql.loaders import Loaders, create_loaders
+
+def get_current_user(info) -> Optional[dict]:
+    """Extract user from context"""
+    request = info.context.get("request")
+    if request and hasattr(request.state, 'user'):
+        return request.state.user
+    return None
+
+def get_loaders(info) -> Loaders:
+    """Get the request-scoped batch loaders from context"""
+    loaders = info.context.get("loaders")
+    if loaders is None:
+        loaders = create_loaders()
+        info.context["loaders"] = loaders
+    return loaders
+
+async def viewer_registration_status(info, event_id: str) -> Optional[str]:
+    """The current user's registration status for an event, batched per request"""
+    user = get_current_user(info)
+    if not user:
+        return None
+    return await get_loaders(info).viewer_registration.load((user['userId'], event_id))
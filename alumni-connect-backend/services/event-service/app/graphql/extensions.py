@@ -0,0 +1,138 @@
+import time
+from inspect import isawaitable
+from typing import Optional
+from graphql import ExecutionResult, FieldNode, GraphQLError, OperationDefinitionNode
+from strawberry.extensions import SchemaExtension
+from app.graphql.limits import MAX_QUERY_COST, MAX_QUERY_DEPTH, operation_cost
+from app.observability.metrics import (
+    db_queries, db_queries_per_request, db_query_seconds, db_time_per_request,
+    graphql_duration, graphql_errors, graphql_in_flight, graphql_requests,
+    resolver_duration
+)
+from app.observability.sql import check_budget, track_queries
+
+ROOT_TYPES = ("Query", "Mutation")
+
+def find_operation(execution_context) -> Optional[OperationDefinitionNode]:
+    """The operation definition that will run for this request"""
+    document = execution_context.graphql_document
+    if document is None:
+        return None
+    for definition in document.definitions:
+        if not isinstance(definition, OperationDefinitionNode):
+            continue
+        name = definition.name.value if definition.name else None
+        if execution_context.operation_name and name != execution_context.operation_name:
+            continue
+        return definition
+    return None
+
+def operation_label(execution_context) -> str:
+    """Name an operation by its root fields so labels stay bounded"""
+    if execution_context.graphql_document is None:
+        return "invalid"
+    definition = find_operation(execution_context)
+    if definition is None:
+        return "unknown"
+    fields = sorted({
+        selection.name.value
+        for selection in definition.selection_set.selections
+        if isinstance(selection, FieldNode)
+    })
+    # Unknown field names come from the client and would make labels unbounded
+    root_type = execution_context.schema._schema.get_root_type(definition.operation)
+    if root_type is None or any(
+        field not in root_type.fields and not field.startswith("__") for field in fields
+    ):
+        return "invalid"
+    return "+".join(fields) or "unknown"
+
+class MetricsExtension(SchemaExtension):
+    """Record per-operation latency, errors and SQL usage, and per-resolver latency"""
+
+    def on_operation(self):
+        graphql_in_flight.inc()
+        start = time.perf_counter()
+        try:
+            with track_queries() as stats:
+                yield
+        finally:
+            elapsed = time.perf_counter() - start
+            graphql_in_flight.dec()
+
+            operation = operation_label(self.execution_context)
+            # Read from the parsed document: execution_context.operation_type
+            # raises when parsing failed or the operation name matches nothing
+            definition = find_operation(self.execution_context)
+            graphql_requests.inc(
+                operation=operation,
+                type=definition.operation.value if definition else "unknown"
+            )
+            graphql_duration.observe(elapsed, operation=operation)
+            if self.execution_context.errors:
+                graphql_errors.inc(len(self.execution_context.errors), operation=operation)
+            db_queries.inc(stats.count, operation=operation)
+            db_query_seconds.inc(stats.seconds, operation=operation)
+            db_queries_per_request.observe(stats.count, operation=operation)
+            db_time_per_request.observe(stats.seconds, operation=operation)
+            check_budget(operation, stats)
+
+    def resolve(self, _next, root, info, *args, **kwargs):
+        # Root fields are always timed, nested fields only when they do async work
+        start = time.perf_counter()
+        result = _next(root, info, *args, **kwargs)
+        if isawaitable(result):
+            return self._timed(result, f"{info.parent_type.name}.{info.field_name}", start)
+        if info.parent_type.name in ROOT_TYPES:
+            resolver_duration.observe(
+                time.perf_counter() - start,
+                field=f"{info.parent_type.name}.{info.field_name}"
+            )
+        return result
+
+    async def _timed(self, result, field: str, start: float):
+        try:
+            return await result
+        finally:
+            resolver_duration.observe(time.perf_counter() - start, field=field)
+
+class QueryCostExtension(SchemaExtension):
+    """Reject operations above MAX_QUERY_COST / MAX_QUERY_DEPTH and report their cost"""
+
+    def __init__(self, *, execution_context=None):
+        self.cost: Optional[int] = None
+        self.depth: Optional[int] = None
+
+    def on_execute(self):
+        # Runs after validation, so the document is well-formed and variables are known
+        operation = find_operation(self.execution_context)
+        if operation is not None:
+            self.cost, self.depth = operation_cost(
+                self.execution_context.graphql_document,
+                operation,
+                self.execution_context.variables
+            )
+            message = None
+            if self.depth > MAX_QUERY_DEPTH:
+                message = f"Query depth {self.depth} exceeds the maximum of {MAX_QUERY_DEPTH}"
+            elif self.cost > MAX_QUERY_COST:
+                message = f"Query cost {self.cost} exceeds the maximum of {MAX_QUERY_COST}"
+            if message:
+                # A preset result makes strawberry skip execution
+                self.execution_context.result = ExecutionResult(
+                    data=None,
+                    errors=[GraphQLError(message, extensions={"code": "QUERY_TOO_COMPLEX"})]
+                )
+        yield
+
+    def get_results(self):
+        if self.cost is None:
+            return {}
+        return {
+            "cost": {
+                "requested": self.cost,
+                "maximum": MAX_QUERY_COST,
+                "depth": self.depth,
+                "maximumDepth": MAX_QUERY_DEPTH,
+            }
+        }
@@ -0,0 +1,87 @@
+import os
+from typing import Dict, Optional, Tuple
+from graphql import (
+    FieldNode, FragmentDefinitionNode, FragmentSpreadNode, InlineFragmentNode,
+    OperationDefinitionNode, SelectionSetNode, value_from_ast_untyped
+)
+
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 100))
+MAX_QUERY_COST = int(os.getenv("MAX_QUERY_COST", 5000))
+MAX_QUERY_DEPTH = int(os.getenv("MAX_QUERY_DEPTH", 8))
+# Rows assumed for list fields without a page size argument
+ASSUMED_LIST_SIZE = int(os.getenv("ASSUMED_LIST_SIZE", 50))
+DEFAULT_PAGE_SIZE = 20
+
+# Sort keys backed by a B-tree index (ties are broken on the primary key)
+SORTABLE_COLUMNS = ("startDate", "createdAt")
+
+def check_filter(filter) -> None:
+    """Reject page sizes and sort keys the listing queries can't serve cheaply"""
+    if filter.limit < 1 or filter.limit > MAX_PAGE_SIZE:
+        raise Exception(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    if filter.offset < 0:
+        raise Exception("offset cannot be negative")
+    if filter.orderBy not in SORTABLE_COLUMNS:
+        raise Exception(f"Cannot order by '{filter.orderBy}', use one of: {', '.join(SORTABLE_COLUMNS)}")
+    if filter.order.lower() not in ("asc", "desc"):
+        raise Exception("order must be 'asc' or 'desc'")
+
+def _page_size(field: FieldNode, variables: Dict) -> int:
+    for argument in field.arguments:
+        if argument.name.value == "filter":
+            value = value_from_ast_untyped(argument.value, variables) or {}
+            limit = value.get("limit", DEFAULT_PAGE_SIZE) if isinstance(value, dict) else DEFAULT_PAGE_SIZE
+            if isinstance(limit, int):
+                # check_filter rejects larger pages with a clearer message
+                return max(1, min(limit, MAX_PAGE_SIZE))
+    return DEFAULT_PAGE_SIZE
+
+# Root fields returning pages of rows: how many rows a request asks for
+LIST_SIZES = {
+    "events": _page_size,
+    "searchEvents": _page_size,
+    "myRegistrations": lambda field, variables: ASSUMED_LIST_SIZE,
+}
+
+def _selection_cost(
+    selection_set: SelectionSetNode,
+    fragments: Dict[str, FragmentDefinitionNode],
+    variables: Dict,
+    depth: int
+) -> Tuple[int, int]:
+    cost, max_depth = 0, depth
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            # Introspection is served from the schema, not the database
+            if selection.name.value.startswith("__"):
+                continue
+            child_cost, child_depth = 0, depth + 1
+            if selection.selection_set:
+                child_cost, child_depth = _selection_cost(
+                    selection.selection_set, fragments, variables, depth + 1
+                )
+            size = LIST_SIZES.get(selection.name.value) if depth == 0 else None
+            cost += 1 + child_cost * (size(selection, variables) if size else 1)
+        else:
+            if isinstance(selection, FragmentSpreadNode):
+                fragment = fragments.get(selection.name.value)
+                if fragment is None:
+                    continue
+                nested = fragment.selection_set
+            elif isinstance(selection, InlineFragmentNode):
+                nested = selection.selection_set
+            else:
+                continue
+            child_cost, child_depth = _selection_cost(nested, fragments, variables, depth)
+            cost += child_cost
+        max_depth = max(max_depth, child_depth)
+    return cost, max_depth
+
+def operation_cost(document, operation: OperationDefinitionNode, variables: Optional[Dict]) -> Tuple[int, int]:
+    """(cost, depth) of an operation: every field costs 1, page fields multiply by rows"""
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    return _selection_cost(operation.selection_set, fragments, variables or {}, 0)
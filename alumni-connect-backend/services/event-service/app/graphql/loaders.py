@@ -0,0 +1,41 @@
+from typing import List, Optional, Tuple
+from sqlalchemy import select
+from strawberry.dataloader import DataLoader
+from app.database.connection import AsyncSessionLocal
+from app.models.event import Registration as RegistrationModel
+
+async def load_viewer_registrations(keys: List[Tuple[str, str]]) -> List[Optional[str]]:
+    """Batch registration statuses per (userId, eventId) with one IN (...) query"""
+    user_ids = {user_id for user_id, _ in keys}
+    event_ids = {event_id for _, event_id in keys}
+
+    async with AsyncSessionLocal() as db:
+        rows = (await db.execute(
+            select(
+                RegistrationModel.userId,
+                RegistrationModel.eventId,
+                RegistrationModel.status
+            ).where(
+                RegistrationModel.userId.in_(user_ids),
+                RegistrationModel.eventId.in_(event_ids)
+            )
+        )).all()
+
+    statuses = {(user_id, event_id): status.value for user_id, event_id, status in rows}
+    return [statuses.get(key) for key in keys]
+
+class Loaders:
+    """Request-scoped container for all batch loaders"""
+
+    def __init__(self):
+        self.viewer_registration = DataLoader(load_fn=load_viewer_registrations)
+
+    def forget_registration(self, user_id: str, event_id: str) -> None:
+        """Drop cached values a registration change has made stale"""
+        try:
+            self.viewer_registration.clear((user_id, event_id))
+        except KeyError:
+            pass
+
+def create_loaders() -> Loaders:
+    return Loaders()
@@ -0,0 +1,69 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Tuple
+from sqlalchemy import DateTime, Select, func, select, tuple_
+from sqlalchemy.exc import UnsupportedCompilationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from app.models.event import Event as EventModel
+
+def encode_cursor(order_by: str, value: Any, event_id: str) -> Optional[str]:
+    """Build an opaque cursor for the (orderBy column, id) position of a row"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif hasattr(value, "value"):
+        value = value.value
+    payload = json.dumps({"k": order_by, "v": value, "id": event_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+def decode_cursor(cursor: str, order_by: str) -> Tuple[Any, str]:
+    """Return the (orderBy value, id) position encoded in a cursor"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        key, value, event_id = payload["k"], payload["v"], payload["id"]
+        if key != order_by or value is None:
+            raise ValueError(key)
+        if isinstance(getattr(EventModel, order_by).type, DateTime):
+            value = datetime.fromisoformat(value)
+    except (ValueError, KeyError, TypeError):
+        raise Exception("Invalid cursor")
+    return value, event_id
+
+def apply_keyset(query: Select, order_column, after: Tuple[Any, str], descending: bool) -> Select:
+    """Continue a query after the (orderBy value, id) position from decode_cursor"""
+    value, event_id = after
+    position = tuple_(order_column, EventModel.id)
+    if descending:
+        return query.where(position < tuple_(value, event_id))
+    return query.where(position > tuple_(value, event_id))
+
+async def exact_count(db: AsyncSession, query: Select) -> int:
+    return await db.scalar(select(func.count()).select_from(query.subquery()))
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, executed with its bound parameters"""
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+async def estimated_count(db: AsyncSession, query: Select) -> int:
+    """Planner row estimate for a query, or an exact count where EXPLAIN is unsupported"""
+    try:
+        # Separate connection so a failed EXPLAIN can't abort the caller's transaction
+        async with db.bind.connect() as conn:
+            plan = (await conn.execute(Explain(query))).scalar()
+    except UnsupportedCompilationError:
+        # Only Postgres has an Explain compiler
+        return await exact_count(db, query)
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
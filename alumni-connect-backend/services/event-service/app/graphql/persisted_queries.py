@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+from typing import Optional
+from graphql import GraphQLError
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLRequestData
+from strawberry.types import ExecutionResult
+from app.cache.ttl_cache import TTLCache
+
+class PersistedQueryError(Exception):
+    def __init__(self, message: str, code: str):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+class PersistedQueryStore:
+    """Automatic persisted queries: sha256 hash -> query text (Apollo APQ protocol)"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def resolve(self, query: Optional[str], extensions: Optional[dict]) -> Optional[str]:
+        """Return the query text to execute, registering new hash/query pairs"""
+        persisted = (extensions or {}).get("persistedQuery")
+        if not persisted:
+            return query
+        if not isinstance(persisted, dict):
+            raise PersistedQueryError("Invalid persistedQuery extension", "BAD_REQUEST")
+
+        if persisted.get("version") != 1:
+            raise PersistedQueryError("Unsupported persisted query version", "PERSISTED_QUERY_NOT_SUPPORTED")
+        digest = persisted.get("sha256Hash")
+        if not isinstance(digest, str):
+            raise PersistedQueryError("Missing sha256Hash", "BAD_REQUEST")
+
+        if query is None:
+            query = self._cache.get(digest)
+            if query is None:
+                # Tells the client to retry with the full query text
+                raise PersistedQueryError("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+            return query
+
+        if hashlib.sha256(query.encode()).hexdigest() != digest:
+            raise PersistedQueryError("provided sha does not match query", "BAD_REQUEST")
+        self._cache.set(digest, query)
+        return query
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+persisted_queries = PersistedQueryStore(
+    maxsize=int(os.getenv("PERSISTED_QUERY_CACHE_SIZE", 1000)),
+    ttl=float(os.getenv("PERSISTED_QUERY_TTL", 86400))
+)
+
+class PersistedQueryRouter(GraphQLRouter):
+    """GraphQLRouter that accepts hash-only requests for persisted queries"""
+
+    def should_render_graphql_ide(self, request) -> bool:
+        # A hash-only GET has no "query" param but is an operation, not a browser visit
+        if request.query_params.get("extensions"):
+            return False
+        return super().should_render_graphql_ide(request)
+
+    async def parse_http_body(self, request) -> GraphQLRequestData:
+        data = await super().parse_http_body(request)
+
+        # The base parser drops the "extensions" member, so read it back from the request
+        if request.method == "GET":
+            extensions = request.query_params.get("extensions")
+            extensions = json.loads(extensions) if extensions else None
+        elif "application/json" in (request.content_type or ""):
+            body = json.loads(await request.get_body())
+            extensions = body.get("extensions") if isinstance(body, dict) else None
+        else:
+            extensions = None
+
+        data.query = persisted_queries.resolve(data.query, extensions)
+        return data
+
+    async def execute_operation(self, request, context, root_value):
+        try:
+            return await super().execute_operation(request, context, root_value)
+        except PersistedQueryError as e:
+            # APQ clients expect a regular GraphQL error response, not an HTTP error
+            return ExecutionResult(
+                data=None,
+                errors=[GraphQLError(e.message, extensions={"code": e.code})]
+            )
@@ -1,277 +1,337 @@
+import os
 import strawberry
+from strawberry.extensions import ParserCache, ValidationCache
 from strawberry.types import Info
 from typing import Optional, List
-from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, func, and_
+from datetime import datetime, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, load_only
+from sqlalchemy import inspect, select
 from app.graphql.types import (
-    Event, EventsResponse, Registration, MessageResponse, Pagination,
+    Event, EventsResponse, EventSearchResult, EventSearchResponse,
+    Registration, MessageResponse, ModerationResult, Pagination,
+    CheckInResult, CheckInResponse,
     CreateEventInput, UpdateEventInput, RegisterEventInput, EventFilterInput,
-    RegistrationStatus
+    EventRejectionInput, EventStatus, RegistrationStatus, TotalCountMode
 )
 from app.models.event import Event as EventModel, Registration as RegistrationModel
-from app.database.connection import get_db
+from app.database.connection import AsyncSessionLocal
+from app.graphql.context import get_current_user, get_loaders
+from app.graphql.extensions import MetricsExtension, QueryCostExtension
+from app.graphql.limits import check_filter
+from app.graphql.selection import event_columns, selected_subfields
+from app.cache.event_listing import event_listing_cache
+from app.services.checkin import CheckInOutcome, check_in
+from app.services.moderation import ModerationOutcome, approve_events, reject_events
+from app.services.registration import release_seat, reserve_seat
+from app.services.view_counter import view_counter
+from app.graphql.search import load_headlines, search_condition, search_rank
+from app.graphql.pagination import (
+    apply_keyset, decode_cursor, encode_cursor, estimated_count, exact_count
+)
+
+def parse_datetime(value: str) -> datetime:
+    """Parse an ISO date string into a naive UTC datetime for timestamp columns"""
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def apply_event_filters(query, filter: EventFilterInput):
+    """Apply the EventFilterInput conditions shared by events and searchEvents"""
+    # Filter by status
+    if filter.status:
+        query = query.where(EventModel.status == filter.status.value)
+    
+    # Apply full-text search (GIN-indexed searchVector)
+    if filter.search:
+        query = query.where(search_condition(filter.search))
+    
+    # Apply type filter
+    if filter.type:
+        query = query.where(EventModel.type == filter.type.value)
+    
+    # Apply isOnline filter
+    if filter.isOnline is not None:
+        query = query.where(EventModel.isOnline == filter.isOnline)
+    
+    # Apply organizerId filter
+    if filter.organizerId:
+        query = query.where(EventModel.organizerId == filter.organizerId)
+    
+    # Apply upcoming filter
+    if filter.upcoming:
+        query = query.where(EventModel.startDate >= datetime.utcnow())
+    
+    return query
+
+def to_event(event: EventModel) -> Event:
+    """Build the GraphQL Event type from an Event model; derived fields resolve lazily"""
+    # Columns skipped by load_only were not selected, so their placeholder is never
+    # resolved; reading them would trigger a lazy load on the async session
+    unloaded = inspect(event).unloaded
+    
+    def column(name: str, default=None):
+        return default if name in unloaded else getattr(event, name)
+    
+    return Event(
+        id=event.id,
+        organizerId=column('organizerId'),
+        title=column('title'),
+        description=column('description'),
+        type=column('type'),
+        status=column('status'),
+        coverImage=column('coverImage'),
+        startDate=column('startDate'),
+        endDate=column('endDate'),
+        location=column('location'),
+        isOnline=column('isOnline'),
+        meetingUrl=column('meetingUrl'),
+        capacity=column('capacity'),
+        currentAttendees=column('currentAttendees') or 0,
+        attendedCount=column('attendedCount') or 0,
+        price=column('price') or 0,
+        currency=column('currency') or "IDR",
+        tags=column('tags') or [],
+        requirements=column('requirements'),
+        agenda=column('agenda'),
+        speakers=column('speakers'),
+        viewCount=column('viewCount') or 0,
+        createdAt=column('createdAt'),
+        updatedAt=column('updatedAt')
+    )
 
-def get_current_user(info) -> Optional[dict]:
-    """Extract user from context"""
-    request = info.context.get("request")
-    if request and hasattr(request.state, 'user'):
-        return request.state.user
-    return None
+def require_super_admin(info) -> dict:
+    """Moderation is reserved for SUPER_ADMIN, as in the identity service"""
+    user = get_current_user(info)
+    if not user:
+        raise Exception("Not authenticated")
+    if user.get('role') != 'SUPER_ADMIN':
+        raise Exception("Unauthorized: Super Admin access required")
+    return user
+
+def to_moderation_result(outcome: ModerationOutcome) -> ModerationResult:
+    return ModerationResult(
+        eventId=outcome.event_id,
+        success=outcome.success,
+        status=EventStatus[outcome.status] if outcome.status else None,
+        message=outcome.message
+    )
+
+def to_check_in_result(outcome: CheckInOutcome) -> CheckInResult:
+    return CheckInResult(
+        token=outcome.token,
+        success=outcome.success,
+        registrationId=outcome.registration_id,
+        alreadyCheckedIn=outcome.already_checked_in,
+        attendedAt=outcome.attended_at,
+        message=outcome.message
+    )
 
 @strawberry.type
 class Query:
     @strawberry.field
-    def events(
+    async def events(
         self,
         filter: Optional[EventFilterInput] = None,
         info: Info = None
     ) -> EventsResponse:
-        db: Session = next(get_db())
         user = get_current_user(info)
+        filter = filter or EventFilterInput()
+        check_filter(filter)
+        
+        # Reject a malformed cursor before paying for a count query or EXPLAIN
+        after = None
+        if filter.after:
+            after = decode_cursor(filter.after, getattr(EventModel, filter.orderBy).key)
+        
+        # Only load the Event columns the selection set needs
+        selected = selected_subfields(info, "events")
+        cache_columns = frozenset(column.key for column in event_columns(selected))
         
+        # Anonymous listings are identical for everyone, serve them from cache
+        if not user:
+            cached = event_listing_cache.get(filter, cache_columns)
+            if cached is not None:
+                return cached
+        
+        db: AsyncSession = AsyncSessionLocal()
         try:
-            filter = filter or EventFilterInput()
-            query = db.query(EventModel)
-            
-            # Filter by status
-            if filter.status:
-                query = query.filter(EventModel.status == filter.status.value)
-            
-            # Apply search
-            if filter.search:
-                query = query.filter(
-                    or_(
-                        EventModel.title.ilike(f"%{filter.search}%"),
-                        EventModel.description.ilike(f"%{filter.search}%"),
-                        EventModel.location.ilike(f"%{filter.search}%")
-                    )
-                )
-            
-            # Apply type filter
-            if filter.type:
-                query = query.filter(EventModel.type == filter.type.value)
-            
-            # Apply isOnline filter
-            if filter.isOnline is not None:
-                query = query.filter(EventModel.isOnline == filter.isOnline)
-            
-            # Apply organizerId filter
-            if filter.organizerId:
-                query = query.filter(EventModel.organizerId == filter.organizerId)
+            query = apply_event_filters(select(EventModel), filter)
+            
+            # Count total (exact, planner estimate, or skipped)
+            total = None
+            if filter.totalCount == TotalCountMode.EXACT:
+                total = await exact_count(db, query)
+            elif filter.totalCount == TotalCountMode.ESTIMATED:
+                total = await estimated_count(db, query)
+            
+            # Order by (orderBy column, id) so cursors have a stable position
+            # orderBy is limited to indexed columns by check_filter
+            order_column = getattr(EventModel, filter.orderBy)
+            order_key = order_column.key
+            descending = filter.order.lower() == "desc"
+            if descending:
+                query = query.order_by(order_column.desc(), EventModel.id.desc())
+            else:
+                query = query.order_by(order_column.asc(), EventModel.id.asc())
             
-            # Apply upcoming filter
-            if filter.upcoming:
-                query = query.filter(EventModel.startDate >= datetime.utcnow())
+            # Keyset pagination when a cursor is given, offset otherwise
+            if after:
+                query = apply_keyset(query, order_column, after, descending)
+            else:
+                query = query.offset(filter.offset)
             
-            # Count total
-            total = query.count()
+            # Fetch one extra row to know whether another page exists
+            query = query.options(load_only(*event_columns(selected, order_key)))
+            events = (await db.scalars(query.limit(filter.limit + 1))).all()
+            has_more = len(events) > filter.limit
+            events = events[:filter.limit]
             
-            # Order and paginate
-            order_column = getattr(EventModel, filter.orderBy, EventModel.startDate)
-            if filter.order == "desc":
-                query = query.order_by(order_column.desc())
-            else:
-                query = query.order_by(order_column.asc())
+            end_cursor = None
+            if events:
+                last = events[-1]
+                end_cursor = encode_cursor(order_key, getattr(last, order_key), last.id)
             
-            events = query.limit(filter.limit).offset(filter.offset).all()
+            event_ids = [event.id for event in events]
+
+            # Viewer-specific fields (hasRegistered, registrationStatus) are
+            # batch-loaded by Event's field resolvers only when selected
+            event_list = [to_event(event) for event in events]
             
-            # Build event list with calculated fields
-            event_list = []
-            for event in events:
-                registrations_count = db.query(func.count(RegistrationModel.id)).filter(
-                    RegistrationModel.eventId == event.id
-                ).scalar()
-                
-                days_left = max(0, (event.endDate - datetime.utcnow()).days)
-                is_full = event.capacity and registrations_count >= event.capacity
-                
-                has_registered = False
-                registration_status = None
-                if user:
-                    registration = db.query(RegistrationModel).filter(
-                        and_(
-                            RegistrationModel.eventId == event.id,
-                            RegistrationModel.userId == user['userId']
-                        )
-                    ).first()
-                    if registration:
-                        has_registered = True
-                        registration_status = RegistrationStatus[registration.status.value]
-                
-                event_list.append(Event(
-                    id=event.id,
-                    organizerId=event.organizerId,
-                    title=event.title,
-                    description=event.description,
-                    type=event.type,
-                    status=event.status,
-                    coverImage=event.coverImage,
-                    startDate=event.startDate,
-                    endDate=event.endDate,
-                    location=event.location,
-                    isOnline=event.isOnline,
-                    meetingUrl=event.meetingUrl,
-                    capacity=event.capacity,
-                    currentAttendees=event.currentAttendees,
-                    price=event.price,
-                    currency=event.currency,
-                    tags=event.tags or [],
-                    requirements=event.requirements,
-                    agenda=event.agenda,
-                    speakers=event.speakers,
-                    viewCount=event.viewCount,
-                    createdAt=event.createdAt,
-                    updatedAt=event.updatedAt,
-                    registrationsCount=registrations_count,
-                    hasRegistered=has_registered,
-                    registrationStatus=registration_status,
-                    isFull=is_full,
-                    daysLeft=days_left
+            response = EventsResponse(
+                events=event_list,
+                pagination=Pagination(
+                    total=total,
+                    limit=filter.limit,
+                    offset=0 if filter.after else filter.offset,
+                    hasMore=has_more,
+                    totalIsEstimate=filter.totalCount == TotalCountMode.ESTIMATED,
+                    endCursor=end_cursor
+                )
+            )
+            if not user:
+                event_listing_cache.set(filter, response, event_ids, cache_columns)
+            return response
+        finally:
+            await db.close()
+
+    @strawberry.field
+    async def searchEvents(
+        self,
+        query: str,
+        filter: Optional[EventFilterInput] = None,
+        info: Info = None
+    ) -> EventSearchResponse:
+        db: AsyncSession = AsyncSessionLocal()
+        
+        try:
+            filter = filter or EventFilterInput()
+            check_filter(filter)
+            filter.search = query
+            
+            rank = search_rank(query).label("rank")
+            stmt = apply_event_filters(select(EventModel, rank), filter)
+            
+            total = None
+            if filter.totalCount == TotalCountMode.EXACT:
+                total = await exact_count(db, stmt)
+            elif filter.totalCount == TotalCountMode.ESTIMATED:
+                total = await estimated_count(db, stmt)
+            
+            # Most relevant first, id as a stable tiebreaker
+            rows = (await db.execute(
+                stmt.order_by(rank.desc(), EventModel.id.asc())
+                .limit(filter.limit + 1)
+                .offset(filter.offset)
+            )).all()
+            has_more = len(rows) > filter.limit
+            rows = rows[:filter.limit]
+            
+            event_ids = [event.id for event, _ in rows]
+            headlines = await load_headlines(db, event_ids, query)
+            
+            results = []
+            for event, score in rows:
+                results.append(EventSearchResult(
+                    event=to_event(event),
+                    rank=float(score),
+                    headline=headlines.get(event.id)
                 ))
             
-            return EventsResponse(
-                events=event_list,
+            return EventSearchResponse(
+                results=results,
                 pagination=Pagination(
                     total=total,
                     limit=filter.limit,
                     offset=filter.offset,
-                    hasMore=(filter.offset + filter.limit < total)
+                    hasMore=has_more,
+                    totalIsEstimate=filter.totalCount == TotalCountMode.ESTIMATED
                 )
             )
         finally:
-            db.close()
+            await db.close()
 
     @strawberry.field
-    def event(self, id: strawberry.ID, info: Info = None) -> Optional[Event]:
-        db: Session = next(get_db())
-        user = get_current_user(info)
+    async def event(self, id: strawberry.ID, info: Info = None) -> Optional[Event]:
+        db: AsyncSession = AsyncSessionLocal()
         
         try:
-            event = db.query(EventModel).filter(EventModel.id == str(id)).first()
+            event = await db.get(EventModel, str(id))
             if not event:
                 raise Exception("Event not found")
             
-            # Increment view count
-            event.viewCount += 1
-            db.commit()
-            
-            registrations_count = db.query(func.count(RegistrationModel.id)).filter(
-                RegistrationModel.eventId == event.id
-            ).scalar()
-            
-            days_left = max(0, (event.endDate - datetime.utcnow()).days)
-            is_full = event.capacity and registrations_count >= event.capacity
-            
-            has_registered = False
-            registration_status = None
-            if user:
-                registration = db.query(RegistrationModel).filter(
-                    and_(
-                        RegistrationModel.eventId == event.id,
-                        RegistrationModel.userId == user['userId']
-                    )
-                ).first()
-                if registration:
-                    has_registered = True
-                    registration_status = RegistrationStatus[registration.status.value]
-            
-            return Event(
-                id=event.id,
-                organizerId=event.organizerId,
-                title=event.title,
-                description=event.description,
-                type=event.type,
-                status=event.status,
-                coverImage=event.coverImage,
-                startDate=event.startDate,
-                endDate=event.endDate,
-                location=event.location,
-                isOnline=event.isOnline,
-                meetingUrl=event.meetingUrl,
-                capacity=event.capacity,
-                currentAttendees=event.currentAttendees,
-                price=event.price,
-                currency=event.currency,
-                tags=event.tags or [],
-                requirements=event.requirements,
-                agenda=event.agenda,
-                speakers=event.speakers,
-                viewCount=event.viewCount,
-                createdAt=event.createdAt,
-                updatedAt=event.updatedAt,
-                registrationsCount=registrations_count,
-                hasRegistered=has_registered,
-                registrationStatus=registration_status,
-                isFull=is_full,
-                daysLeft=days_left
-            )
+            # Buffer the view; it is written back in batches off the read path
+            view_counter.increment(event.id)
+            
+            result = to_event(event)
+            result.viewCount += view_counter.pending(event.id)
+            return result
         finally:
-            db.close()
+            await db.close()
 
     @strawberry.field
-    def myRegistrations(
+    async def myRegistrations(
         self,
         status: Optional[RegistrationStatus] = None,
         upcoming: bool = False,
         info: Info = None
     ) -> List[Registration]:
-        db: Session = next(get_db())
         user = get_current_user(info)
         
         if not user:
             raise Exception("Not authenticated")
         
+        db: AsyncSession = AsyncSessionLocal()
         try:
-            query = db.query(RegistrationModel).filter(
+            # Load registrations together with their events in a single joined query
+            query = select(RegistrationModel).join(
+                RegistrationModel.event
+            ).options(
+                contains_eager(RegistrationModel.event).load_only(
+                    *event_columns(selected_subfields(info, "event"))
+                )
+            ).where(
                 RegistrationModel.userId == user['userId']
             )
             
             if status:
-                query = query.filter(RegistrationModel.status == status.value)
+                query = query.where(RegistrationModel.status == status.value)
             
             if upcoming:
-                query = query.join(EventModel).filter(
-                    EventModel.startDate >= datetime.utcnow()
-                )
+                query = query.where(EventModel.startDate >= datetime.utcnow())
             
-            registrations = query.order_by(RegistrationModel.registeredAt.desc()).all()
+            registrations = (await db.scalars(
+                query.order_by(RegistrationModel.registeredAt.desc())
+            )).all()
             
+            # The viewer's statuses are already known; prime the loader so
+            # Event.hasRegistered / registrationStatus don't query again
+            loaders = get_loaders(info)
             result = []
             for r in registrations:
-                event_model = db.query(EventModel).filter(EventModel.id == r.eventId).first()
-                
-                event_obj = None
-                if event_model:
-                    event_obj = Event(
-                        id=event_model.id,
-                        organizerId=event_model.organizerId,
-                        title=event_model.title,
-                        description=event_model.description,
-                        type=event_model.type,
-                        status=event_model.status,
-                        coverImage=event_model.coverImage,
-                        startDate=event_model.startDate,
-                        endDate=event_model.endDate,
-                        location=event_model.location,
-                        isOnline=event_model.isOnline,
-                        meetingUrl=event_model.meetingUrl,
-                        capacity=event_model.capacity,
-                        currentAttendees=event_model.currentAttendees,
-                        price=event_model.price,
-                        currency=event_model.currency,
-                        tags=event_model.tags or [],
-                        requirements=event_model.requirements,
-                        agenda=event_model.agenda,
-                        speakers=event_model.speakers,
-                        viewCount=event_model.viewCount,
-                        createdAt=event_model.createdAt,
-                        updatedAt=event_model.updatedAt,
-                        registrationsCount=0,
-                        hasRegistered=True,
-                        isFull=False,
-                        daysLeft=max(0, (event_model.endDate - datetime.utcnow()).days)
-                    )
+                loaders.viewer_registration.prime((user['userId'], r.eventId), r.status.value)
+                event_obj = to_event(r.event)
                 
                 result.append(Registration(
                     id=r.id,
@@ -287,22 +347,22 @@ class Query:
             
             return result
         finally:
-            db.close()
+            await db.close()
 
 @strawberry.type
 class Mutation:
     @strawberry.mutation
-    def createEvent(
+    async def createEvent(
         self,
         input: CreateEventInput,
         info: Info = None
     ) -> Event:
-        db: Session = next(get_db())
         user = get_current_user(info)
         
         if not user:
             raise Exception("Not authenticated")
         
+        db: AsyncSession = AsyncSessionLocal()
         try:
             # Handle speakers field - convert to JSON string if it's not already
             import json
@@ -324,8 +384,8 @@ class Mutation:
                 description=input.description,
                 type=input.type.value,
                 coverImage=input.coverImage,
-                startDate=datetime.fromisoformat(input.startDate.replace('Z', '+00:00')),
-                endDate=datetime.fromisoformat(input.endDate.replace('Z', '+00:00')),
+                startDate=parse_datetime(input.startDate),
+                endDate=parse_datetime(input.endDate),
                 location=input.location,
                 isOnline=input.isOnline,
                 meetingUrl=input.meetingUrl,
@@ -339,97 +399,40 @@ class Mutation:
             )
             
             db.add(event)
-            db.commit()
-            db.refresh(event)
-            
-            return Event(
-                id=event.id,
-                organizerId=event.organizerId,
-                title=event.title,
-                description=event.description,
-                type=event.type,
-                status=event.status,
-                coverImage=event.coverImage,
-                startDate=event.startDate,
-                endDate=event.endDate,
-                location=event.location,
-                isOnline=event.isOnline,
-                meetingUrl=event.meetingUrl,
-                capacity=event.capacity,
-                currentAttendees=0,
-                price=event.price,
-                currency=event.currency,
-                tags=event.tags or [],
-                requirements=event.requirements,
-                agenda=event.agenda,
-                speakers=event.speakers,
-                viewCount=0,
-                createdAt=event.createdAt,
-                updatedAt=event.updatedAt,
-                registrationsCount=0,
-                hasRegistered=False,
-                isFull=False,
-                daysLeft=max(0, (event.endDate - datetime.utcnow()).days)
-            )
+            await db.commit()
+            await db.refresh(event)
+            event_listing_cache.invalidate_statuses([EventStatus.PENDING_APPROVAL.value])
+            
+            return to_event(event)
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise e
         finally:
-            db.close()
+            await db.close()
 
     @strawberry.mutation
-    def registerEvent(
+    async def registerEvent(
         self,
         eventId: strawberry.ID,
         input: Optional[RegisterEventInput] = None,
         info: Info = None
     ) -> Registration:
-        db: Session = next(get_db())
         user = get_current_user(info)
         
         if not user:
             raise Exception("Not authenticated")
         
+        db: AsyncSession = AsyncSessionLocal()
         try:
-            event = db.query(EventModel).filter(EventModel.id == str(eventId)).first()
-            if not event:
-                raise Exception("Event not found")
-            
-            if event.status != 'PUBLISHED':
-                raise Exception("Event is not available for registration")
-            
-            existing = db.query(RegistrationModel).filter(
-                and_(
-                    RegistrationModel.eventId == str(eventId),
-                    RegistrationModel.userId == user['userId']
-                )
-            ).first()
-            
-            if existing:
-                raise Exception("You have already registered for this event")
-            
-            registrations_count = db.query(func.count(RegistrationModel.id)).filter(
-                RegistrationModel.eventId == str(eventId)
-            ).scalar()
-            
-            if event.capacity and registrations_count >= event.capacity:
-                raise Exception("Event is full")
-            
-            if datetime.utcnow() > event.startDate:
-                raise Exception("Event has already started")
-            
-            registration = RegistrationModel(
-                eventId=str(eventId),
-                userId=user['userId'],
-                notes=input.notes if input else None,
-                status='REGISTERED'
+            registration = await reserve_seat(
+                db,
+                str(eventId),
+                user['userId'],
+                notes=input.notes if input else None
             )
-            
-            event.currentAttendees += 1
-            
-            db.add(registration)
-            db.commit()
-            db.refresh(registration)
+            await db.commit()
+            get_loaders(info).forget_registration(user['userId'], registration.eventId)
+            event_listing_cache.invalidate_events([registration.eventId])
             
             return Registration(
                 id=registration.id,
@@ -442,170 +445,194 @@ class Mutation:
                 updatedAt=registration.updatedAt
             )
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise e
         finally:
-            db.close()
+            await db.close()
 
     @strawberry.mutation
-    def cancelRegistration(
+    async def cancelRegistration(
         self,
         eventId: strawberry.ID,
         info: Info = None
     ) -> MessageResponse:
-        db: Session = next(get_db())
         user = get_current_user(info)
         
         if not user:
             raise Exception("Not authenticated")
         
+        db: AsyncSession = AsyncSessionLocal()
         try:
-            registration = db.query(RegistrationModel).filter(
-                and_(
-                    RegistrationModel.eventId == str(eventId),
-                    RegistrationModel.userId == user['userId']
-                )
-            ).first()
-            
-            if not registration:
-                raise Exception("Registration not found")
-            
-            if registration.status == 'ATTENDED':
-                raise Exception("Cannot cancel after attending")
-            
-            registration.status = 'CANCELLED'
-            
-            event = db.query(EventModel).filter(EventModel.id == str(eventId)).first()
-            if event:
-                event.currentAttendees = max(0, event.currentAttendees - 1)
-            
-            db.commit()
+            await release_seat(db, str(eventId), user['userId'])
+            await db.commit()
+            get_loaders(info).forget_registration(user['userId'], str(eventId))
+            event_listing_cache.invalidate_events([str(eventId)])
             
             return MessageResponse(
                 success=True,
                 message="Registration cancelled successfully"
             )
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise e
         finally:
-            db.close()
+            await db.close()
 
     @strawberry.mutation
-    def approveEvent(
+    async def approveEvent(
         self,
         eventId: strawberry.ID,
         info: Info = None
     ) -> Event:
-        db: Session = next(get_db())
-        user = get_current_user(info)
-        
-        if not user:
-            raise Exception("Not authenticated")
+        user = require_super_admin(info)
         
+        db: AsyncSession = AsyncSessionLocal()
         try:
-            event = db.query(EventModel).filter(EventModel.id == str(eventId)).first()
-            if not event:
-                raise Exception("Event not found")
-            
-            event.status = 'PUBLISHED'
-            db.commit()
-            db.refresh(event)
-            
-            return Event(
-                id=event.id,
-                organizerId=event.organizerId,
-                title=event.title,
-                description=event.description,
-                type=event.type,
-                status=event.status,
-                coverImage=event.coverImage,
-                startDate=event.startDate,
-                endDate=event.endDate,
-                location=event.location,
-                isOnline=event.isOnline,
-                meetingUrl=event.meetingUrl,
-                capacity=event.capacity,
-                currentAttendees=event.currentAttendees or 0,
-                price=event.price or 0,
-                currency=event.currency or "IDR",
-                tags=event.tags or [],
-                requirements=event.requirements,
-                agenda=event.agenda,
-                speakers=event.speakers,
-                viewCount=event.viewCount or 0,
-                createdAt=event.createdAt,
-                updatedAt=event.updatedAt,
-                registrationsCount=0,
-                hasRegistered=False,
-                isFull=False,
-                daysLeft=0
-            )
+            # Same path as bulkApproveEvents, so the reviewer is recorded
+            [outcome] = await approve_events(db, [str(eventId)], user['userId'])
+            if not outcome.success:
+                raise Exception(outcome.message)
+            await db.commit()
+            event_listing_cache.invalidate_events([outcome.event_id])
+            event_listing_cache.invalidate_statuses([EventStatus.PENDING_APPROVAL.value, 'PUBLISHED'])
+            
+            return to_event(await db.get(EventModel, outcome.event_id))
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise e
         finally:
-            db.close()
+            await db.close()
 
     @strawberry.mutation
-    def rejectEvent(
+    async def rejectEvent(
         self,
         eventId: strawberry.ID,
         reason: str,
         info: Info = None
     ) -> Event:
-        db: Session = next(get_db())
+        user = require_super_admin(info)
+        
+        db: AsyncSession = AsyncSessionLocal()
+        try:
+            # Same path as bulkRejectEvents, so the reason and reviewer are recorded
+            [outcome] = await reject_events(db, {str(eventId): reason}, user['userId'])
+            if not outcome.success:
+                raise Exception(outcome.message)
+            await db.commit()
+            event_listing_cache.invalidate_events([outcome.event_id])
+            event_listing_cache.invalidate_statuses([EventStatus.PENDING_APPROVAL.value, 'REJECTED'])
+            
+            return to_event(await db.get(EventModel, outcome.event_id))
+        except Exception as e:
+            await db.rollback()
+            raise e
+        finally:
+            await db.close()
+
+    @strawberry.mutation
+    async def bulkApproveEvents(
+        self,
+        eventIds: List[strawberry.ID],
+        info: Info = None
+    ) -> List[ModerationResult]:
+        user = require_super_admin(info)
+        
+        db: AsyncSession = AsyncSessionLocal()
+        try:
+            outcomes = await approve_events(db, [str(event_id) for event_id in eventIds], user['userId'])
+            await db.commit()
+            
+            approved = [outcome.event_id for outcome in outcomes if outcome.success]
+            if approved:
+                event_listing_cache.invalidate_events(approved)
+                event_listing_cache.invalidate_statuses([EventStatus.PENDING_APPROVAL.value, 'PUBLISHED'])
+            
+            return [to_moderation_result(outcome) for outcome in outcomes]
+        except Exception as e:
+            await db.rollback()
+            raise e
+        finally:
+            await db.close()
+
+    @strawberry.mutation
+    async def bulkRejectEvents(
+        self,
+        rejections: List[EventRejectionInput],
+        info: Info = None
+    ) -> List[ModerationResult]:
+        user = require_super_admin(info)
+        
+        db: AsyncSession = AsyncSessionLocal()
+        try:
+            reasons = {str(rejection.eventId): rejection.reason for rejection in rejections}
+            outcomes = await reject_events(db, reasons, user['userId'])
+            await db.commit()
+            
+            rejected = [outcome.event_id for outcome in outcomes if outcome.success]
+            if rejected:
+                event_listing_cache.invalidate_events(rejected)
+                event_listing_cache.invalidate_statuses([EventStatus.PENDING_APPROVAL.value, 'REJECTED'])
+            
+            return [to_moderation_result(outcome) for outcome in outcomes]
+        except Exception as e:
+            await db.rollback()
+            raise e
+        finally:
+            await db.close()
+
+    @strawberry.mutation
+    async def checkInAttendees(
+        self,
+        eventId: strawberry.ID,
+        tokens: List[str],
+        info: Info = None
+    ) -> CheckInResponse:
         user = get_current_user(info)
         
         if not user:
             raise Exception("Not authenticated")
         
+        db: AsyncSession = AsyncSessionLocal()
         try:
-            event = db.query(EventModel).filter(EventModel.id == str(eventId)).first()
-            if not event:
+            organizer_id = await db.scalar(
+                select(EventModel.organizerId).where(EventModel.id == str(eventId))
+            )
+            if organizer_id is None:
                 raise Exception("Event not found")
+            if organizer_id != user['userId'] and user.get('role') != 'SUPER_ADMIN':
+                raise Exception("Unauthorized: only the organizer can check in attendees")
+            
+            outcomes, attended_count = await check_in(db, str(eventId), tokens)
+            await db.commit()
+            
+            checked_in = sum(1 for outcome in outcomes if outcome.success and not outcome.already_checked_in)
+            if checked_in:
+                event_listing_cache.invalidate_events([str(eventId)])
             
-            event.status = 'REJECTED'
-            db.commit()
-            db.refresh(event)
-            
-            return Event(
-                id=event.id,
-                organizerId=event.organizerId,
-                title=event.title,
-                description=event.description,
-                type=event.type,
-                status=event.status,
-                coverImage=event.coverImage,
-                startDate=event.startDate,
-                endDate=event.endDate,
-                location=event.location,
-                isOnline=event.isOnline,
-                meetingUrl=event.meetingUrl,
-                capacity=event.capacity,
-                currentAttendees=event.currentAttendees or 0,
-                price=event.price or 0,
-                currency=event.currency or "IDR",
-                tags=event.tags or [],
-                requirements=event.requirements,
-                agenda=event.agenda,
-                speakers=event.speakers,
-                viewCount=event.viewCount or 0,
-                createdAt=event.createdAt,
-                updatedAt=event.updatedAt,
-                registrationsCount=0,
-                hasRegistered=False,
-                isFull=False,
-                daysLeft=0
+            return CheckInResponse(
+                eventId=str(eventId),
+                checkedIn=checked_in,
+                attendedCount=attended_count,
+                results=[to_check_in_result(outcome) for outcome in outcomes]
             )
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise e
         finally:
-            db.close()
+            await db.close()
+
+DOCUMENT_CACHE_SIZE = int(os.getenv("GRAPHQL_DOCUMENT_CACHE_SIZE", 256))
 
 # ✅ FIXED: Create schema without federation
 schema = strawberry.Schema(
     query=Query,
-    mutation=Mutation
-)
\ No newline at end of file
+    mutation=Mutation,
+    extensions=[
+        MetricsExtension,
+        QueryCostExtension,
+        # The frontend sends a small fixed set of operations: parse and
+        # validate each distinct document once
+        ParserCache(maxsize=DOCUMENT_CACHE_SIZE),
+        ValidationCache(maxsize=DOCUMENT_CACHE_SIZE)
+    ]
+)
@@ -0,0 +1,36 @@
+from typing import Dict, List
+from sqlalchemy import cast, func, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.event import Event as EventModel, SEARCH_CONFIG
+
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+
+def to_tsquery(term: str):
+    """Parse user input with web-search syntax (quotes, OR, -exclusion)"""
+    return func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), term)
+
+def search_condition(term: str):
+    """Index-backed match against the generated searchVector column"""
+    return EventModel.searchVector.op("@@")(to_tsquery(term))
+
+def search_rank(term: str):
+    return func.ts_rank_cd(EventModel.searchVector, to_tsquery(term))
+
+async def load_headlines(db: AsyncSession, event_ids: List[str], term: str) -> Dict[str, str]:
+    """Highlighted description snippets, computed only for the returned page"""
+    if not event_ids:
+        return {}
+
+    rows = (await db.execute(
+        select(
+            EventModel.id,
+            func.ts_headline(
+                cast(SEARCH_CONFIG, REGCONFIG),
+                EventModel.description,
+                to_tsquery(term),
+                HEADLINE_OPTIONS
+            )
+        ).where(EventModel.id.in_(event_ids))
+    )).all()
+    return dict(rows)
@@ -0,0 +1,38 @@
+from typing import Iterable, Iterator, List, Set
+from strawberry.types.nodes import SelectedField
+from app.models.event import Event as EventModel
+
+# Model columns behind Event's derived field resolvers
+DERIVED_EVENT_COLUMNS = {
+    "registrationsCount": ("currentAttendees",),
+    "isFull": ("capacity", "currentAttendees"),
+    "percentage": ("capacity", "currentAttendees"),
+    "daysLeft": ("endDate",),
+    "hasRegistered": (),
+    "registrationStatus": (),
+}
+
+def _fields(selections) -> Iterator[SelectedField]:
+    """Selected fields with fragment spreads and inline fragments flattened"""
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            yield selection
+        else:
+            yield from _fields(selection.selections)
+
+def selected_subfields(info, *path: str) -> Set[str]:
+    """Field names selected below the current root field, following path"""
+    fields = list(_fields(info.selected_fields))
+    for name in path:
+        fields = [child for field in fields for child in _fields(field.selections) if child.name == name]
+    return {child.name for field in fields for child in _fields(field.selections)}
+
+def event_columns(field_names: Iterable[str], *required: str) -> List:
+    """Event model columns needed to resolve the selected GraphQL fields"""
+    names = {"id", *required}
+    for field_name in field_names:
+        if field_name in DERIVED_EVENT_COLUMNS:
+            names.update(DERIVED_EVENT_COLUMNS[field_name])
+        elif field_name in EventModel.__table__.columns:
+            names.add(field_name)
+    return [getattr(EventModel, name) for name in sorted(names)]
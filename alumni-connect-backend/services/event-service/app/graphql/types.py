@@ -1,7 +1,10 @@
 import strawberry
+from strawberry.types import Info
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
+from app.auth.checkin import sign_checkin_token
+from app.graphql.context import get_current_user, viewer_registration_status
 
 @strawberry.enum
 class EventType(Enum):
@@ -30,6 +33,12 @@ class RegistrationStatus(Enum):
     ATTENDED = "ATTENDED"
     CANCELLED = "CANCELLED"
 
+@strawberry.enum
+class TotalCountMode(Enum):
+    EXACT = "EXACT"
+    ESTIMATED = "ESTIMATED"
+    NONE = "NONE"
+
 @strawberry.type
 class Event:
     id: str
@@ -46,6 +55,7 @@ class Event:
     meetingUrl: Optional[str]
     capacity: Optional[int]
     currentAttendees: int
+    attendedCount: int
     price: int
     currency: str
     tags: List[str]
@@ -55,12 +65,32 @@ class Event:
     viewCount: int
     createdAt: datetime
     updatedAt: datetime
-    registrationsCount: int
-    hasRegistered: bool = False
-    registrationStatus: Optional[RegistrationStatus] = None
-    isFull: bool = False
-    percentage: float = 0.0
-    daysLeft: int = 0
+
+    @strawberry.field
+    def registrationsCount(self) -> int:
+        # currentAttendees is the authoritative seat counter (see reconcile_attendee_counts)
+        return self.currentAttendees
+
+    @strawberry.field
+    def isFull(self) -> bool:
+        return bool(self.capacity and self.currentAttendees >= self.capacity)
+
+    @strawberry.field
+    def percentage(self) -> float:
+        return round(self.currentAttendees / self.capacity * 100, 2) if self.capacity else 0.0
+
+    @strawberry.field
+    def daysLeft(self) -> int:
+        return max(0, (self.endDate - datetime.utcnow()).days)
+
+    @strawberry.field
+    async def hasRegistered(self, info: Info) -> bool:
+        return await viewer_registration_status(info, self.id) is not None
+
+    @strawberry.field
+    async def registrationStatus(self, info: Info) -> Optional[RegistrationStatus]:
+        status = await viewer_registration_status(info, self.id)
+        return RegistrationStatus[status] if status else None
 
 @strawberry.type
 class Registration:
@@ -74,23 +104,67 @@ class Registration:
     updatedAt: datetime
     event: Optional[Event] = None
 
+    @strawberry.field
+    def checkInToken(self, info: Info) -> Optional[str]:
+        """Signed token for the door scanner, only shown to the registrant"""
+        user = get_current_user(info)
+        if not user or user['userId'] != self.userId or self.status == RegistrationStatus.CANCELLED:
+            return None
+        return sign_checkin_token(self.id, self.eventId)
+
 @strawberry.type
 class Pagination:
-    total: int
+    total: Optional[int]
     limit: int
     offset: int
     hasMore: bool
+    totalIsEstimate: bool = False
+    endCursor: Optional[str] = None
 
 @strawberry.type
 class EventsResponse:
     events: List[Event]
     pagination: Pagination
 
+@strawberry.type
+class EventSearchResult:
+    event: Event
+    rank: float
+    headline: Optional[str] = None
+
+@strawberry.type
+class EventSearchResponse:
+    results: List[EventSearchResult]
+    pagination: Pagination
+
 @strawberry.type
 class MessageResponse:
     success: bool
     message: str
 
+@strawberry.type
+class ModerationResult:
+    eventId: str
+    success: bool
+    status: Optional[EventStatus] = None
+    message: Optional[str] = None
+
+@strawberry.type
+class CheckInResult:
+    token: str
+    success: bool
+    registrationId: Optional[str] = None
+    alreadyCheckedIn: bool = False
+    attendedAt: Optional[datetime] = None
+    message: Optional[str] = None
+
+@strawberry.type
+class CheckInResponse:
+    eventId: str
+    checkedIn: int
+    attendedCount: int
+    results: List[CheckInResult]
+
 @strawberry.input
 class CreateEventInput:
     title: str
@@ -132,6 +206,11 @@ class UpdateEventInput:
 class RegisterEventInput:
     notes: Optional[str] = None
 
+@strawberry.input
+class EventRejectionInput:
+    eventId: strawberry.ID
+    reason: str
+
 @strawberry.input
 class EventFilterInput:
     search: Optional[str] = None
@@ -142,5 +221,7 @@ class EventFilterInput:
     upcoming: bool = False
     limit: int = 20
     offset: int = 0
+    after: Optional[str] = None
+    totalCount: TotalCountMode = TotalCountMode.EXACT
     orderBy: str = "startDate"
     order: str = "asc"
\ No newline at end of file
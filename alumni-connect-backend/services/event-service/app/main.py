@@ -1,20 +1,33 @@
 from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from strawberry.fastapi import GraphQLRouter
 from app.graphql.resolvers import schema
-from app.auth.jwt import get_user_from_token
-from app.database.connection import engine, Base
+from app.graphql.persisted_queries import PersistedQueryRouter, persisted_queries
+from app.routers.exports import router as exports_router
+from app.auth.jwt import get_user_from_token, token_cache_stats
+from app.graphql.loaders import create_loaders
+from app.services.view_counter import view_counter
+from app.database.connection import engine, async_engine, Base, pool_status
+from app.observability.logging import RequestIdMiddleware, setup_logging
+from app.observability.metrics import render_metrics
+from app.observability.sql import instrument_engine
+from sqlalchemy import text
+import logging
+import time
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
+setup_logging()
+
+logger = logging.getLogger("event_service")
 
 # Create tables
 try:
     Base.metadata.create_all(bind=engine)
-    print("✅ Database tables created successfully")
+    logger.info("Database tables created successfully")
 except Exception as e:
-    print(f"❌ Database error: {e}")
+    logger.error("Database error: %s", e)
 
 # Initialize FastAPI
 app = FastAPI(
@@ -32,61 +45,84 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(RequestIdMiddleware)
 
-# Custom context getter for GraphQL
 # Custom context getter for GraphQL
 async def get_context(request: Request):
     """Add user to context from JWT token"""
-    # Get authorization from headers (try both cases)
-    authorization = (
-        request.headers.get("authorization") or 
-        request.headers.get("Authorization") or 
-        ""
-    )
-    
-    print(f"\n📨 ===== PYTHON SERVICE REQUEST =====")
-    print(f"Headers received: {list(request.headers.keys())}")
-    print(f"Authorization header: {'✅ Present' if authorization else '❌ MISSING'}")
-    
-    if authorization:
-        print(f"Authorization preview: {authorization[:30]}...")
+    authorization = request.headers.get("authorization", "")
     
     # Extract user from token
     user = get_user_from_token(authorization)
     
     if user:
-        print(f"✅ User authenticated: {user.get('email')} (ID: {user.get('userId')})")
+        logger.info("GraphQL request authenticated", extra={"userId": user.get("userId"), "sample": True})
+    elif authorization:
+        logger.warning("GraphQL request with invalid credentials")
     else:
-        print(f"❌ Authentication FAILED")
-    
-    print(f"===== END PYTHON SERVICE REQUEST =====\n")
+        logger.debug("GraphQL request without credentials")
     
     # Attach user to request state
     request.state.user = user
     
     return {
         "request": request,
-        "user": user
+        "user": user,
+        "loaders": create_loaders()
     }
 
 # GraphQL Router
-graphql_app = GraphQLRouter(
+graphql_app = PersistedQueryRouter(
     schema,
     context_getter=get_context,
     graphiql=True  # Enable GraphiQL interface
 )
 
 app.include_router(graphql_app, prefix="/graphql")
+app.include_router(exports_router)
+
+# Attribute SQL statements to the GraphQL operation that issued them
+instrument_engine(async_engine)
+
+@app.on_event("startup")
+async def startup():
+    view_counter.start()
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Flush buffered view counts and close pooled async connections"""
+    await view_counter.stop()
+    await async_engine.dispose()
 
 # Health check endpoint
 @app.get("/health")
 async def health_check():
+    # Round-trip latency probe against the database
+    database = {"status": "up"}
+    start = time.perf_counter()
+    try:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        database["latencyMs"] = round((time.perf_counter() - start) * 1000, 3)
+    except Exception as e:
+        database["status"] = "down"
+        database["error"] = str(e)
+    database["pool"] = pool_status()
+    
     return {
-        "status": "healthy",
+        "status": "healthy" if database["status"] == "up" else "degraded",
         "service": "event-service",
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "database": database,
+        "authCache": token_cache_stats(),
+        "persistedQueries": persisted_queries.stats()
     }
 
+# Prometheus scrape endpoint
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -94,11 +130,13 @@ async def root():
         "message": "Event Service API",
         "graphql": "/graphql",
         "health": "/health",
+        "metrics": "/metrics",
+        "exports": "/exports",
         "docs": "/docs"
     }
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("SERVICE_PORT", 4002))
-    print(f"\n🚀 Starting Event Service on port {port}...")
+    logger.info("Starting Event Service on port %s", port)
     uvicorn.run("app.main:app", host="0.0.0.0", port=port, reload=True)
\ No newline at end of file
@@ -1,7 +1,9 @@
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, Enum as SQLEnum, ForeignKey
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, Enum as SQLEnum, ForeignKey, Computed, Index, UniqueConstraint, text
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, JSONB, TSVECTOR
+from sqlalchemy.types import TypeDecorator
 from datetime import datetime
+import json
 import uuid
 import enum
 from app.database.connection import Base
@@ -30,16 +32,52 @@ class RegistrationStatus(str, enum.Enum):
     ATTENDED = "ATTENDED"
     CANCELLED = "CANCELLED"
 
+# Weighted full-text document: title > location > description
+SEARCH_CONFIG = "simple"
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(\"title\", '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(\"location\", '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(\"description\", '')), 'C')"
+)
+
+class JSONText(TypeDecorator):
+    """JSONB column (Prisma Json) exposed to the app as text"""
+    impl = JSONB
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if isinstance(value, str):
+            try:
+                return json.loads(value)
+            except ValueError:
+                # Plain text is stored as a JSON string
+                return value
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        return json.dumps(value)
+
 class Event(Base):
     __tablename__ = "Event"
-    __table_args__ = {'schema': 'identity_schema'}
+    __table_args__ = (
+        Index('Event_searchVector_idx', 'searchVector', postgresql_using='gin'),
+        Index('Event_createdAt_idx', 'createdAt'),
+        # Moderation queue: only the (small) set of pending events is indexed
+        Index(
+            'Event_pendingApproval_createdAt_idx', 'createdAt', 'id',
+            postgresql_where=text("status = 'PENDING_APPROVAL'")
+        ),
+        {'schema': 'identity_schema'}
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     organizerId = Column(String, nullable=False, index=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=False)
-    type = Column(SQLEnum(EventType), nullable=False)
-    status = Column(SQLEnum(EventStatus), default=EventStatus.PUBLISHED, index=True)
+    type = Column(SQLEnum(EventType, name='EventType', schema='identity_schema'), nullable=False)
+    status = Column(SQLEnum(EventStatus, name='EventStatus', schema='identity_schema'), default=EventStatus.PUBLISHED, index=True)
     coverImage = Column(String)
     startDate = Column(DateTime, nullable=False, index=True)
     endDate = Column(DateTime, nullable=False)
@@ -48,27 +86,40 @@ class Event(Base):
     meetingUrl = Column(String)
     capacity = Column(Integer)
     currentAttendees = Column(Integer, default=0)
+    attendedCount = Column(Integer, default=0)
     price = Column(Integer, default=0)
     currency = Column(String, default="IDR")
     tags = Column(ARRAY(String), server_default='{}')
     requirements = Column(Text)
     agenda = Column(Text)
-    speakers = Column(Text)
+    speakers = Column(JSONText)
     viewCount = Column(Integer, default=0)
     createdAt = Column(DateTime, default=datetime.utcnow)
     updatedAt = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Approval fields
+    approvedBy = Column(String)
+    approvedAt = Column(DateTime)
+    rejectedBy = Column(String)
+    rejectedAt = Column(DateTime)
+    rejectionReason = Column(Text)
+
+    searchVector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
+
     # Relationships
     registrations = relationship("Registration", back_populates="event", cascade="all, delete-orphan")
 
 class Registration(Base):
     __tablename__ = "Registration"
-    __table_args__ = {'schema': 'identity_schema'}
+    __table_args__ = (
+        UniqueConstraint('eventId', 'userId', name='Registration_eventId_userId_key'),
+        {'schema': 'identity_schema'}
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     eventId = Column(String, ForeignKey('identity_schema.Event.id', ondelete='CASCADE'), nullable=False, index=True)
     userId = Column(String, nullable=False, index=True)
-    status = Column(SQLEnum(RegistrationStatus), default=RegistrationStatus.REGISTERED, index=True)
+    status = Column(SQLEnum(RegistrationStatus, name='RegistrationStatus', schema='identity_schema'), default=RegistrationStatus.REGISTERED, index=True)
     notes = Column(Text)
     attendedAt = Column(DateTime)
     registeredAt = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,162 @@
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Attributes every LogRecord has; anything else came in through `extra`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message", "asctime", "request_id", "sample", "taskName"
+}
+
+_listener: Optional[QueueListener] = None
+
+# Third-party loggers kept at WARNING whatever LOG_LEVEL is
+QUIET_LOGGERS = ("httpx", "httpcore")
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex
+
+class RequestContextFilter(logging.Filter):
+    """Stamp records with the current request id and sample high-volume lines"""
+
+    def __init__(self, sample_rate: float = 1.0):
+        super().__init__()
+        self.sample_rate = sample_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Runs on the calling task, before the record crosses the queue
+        record.request_id = request_id_var.get()
+        if getattr(record, "sample", False) and record.levelno <= logging.INFO:
+            return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+        return True
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["requestId"] = record.request_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+class TextFormatter(logging.Formatter):
+    """Human-readable lines for local development"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = " ".join(
+            f"{key}={value}" for key, value in vars(record).items() if key not in _RECORD_ATTRS
+        )
+        request_id = getattr(record, "request_id", None)
+        line = f"{self.formatTime(record)} {record.levelname:<7} {record.name}"
+        if request_id:
+            line += f" [{request_id[:8]}]"
+        line += f" {record.getMessage()}"
+        if fields:
+            line += f" {fields}"
+        if record.exc_text:
+            line += "\n" + record.exc_text
+        return line
+
+class ContextQueueHandler(QueueHandler):
+    """QueueHandler that keeps extra fields and renders tracebacks before enqueueing"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+class RequestIdMiddleware:
+    """ASGI middleware that binds a request id (X-Request-ID or a fresh one) to the context"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:64]
+                break
+        request_id = request_id or new_request_id()
+        token = request_id_var.set(request_id)
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [
+                    (b"x-request-id", request_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
+
+def setup_logging() -> None:
+    """Route all logging through a queue so handlers write off the event loop
+
+    LOG_LEVEL sets the root level, LOG_FORMAT picks json or text and
+    LOG_SAMPLE_RATE keeps that share of records logged with extra={"sample": True}.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream = logging.StreamHandler(sys.stdout)
+    if os.getenv("LOG_FORMAT", "json").lower() == "text":
+        stream.setFormatter(TextFormatter())
+    else:
+        stream.setFormatter(JsonFormatter())
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = ContextQueueHandler(log_queue)
+    queue_handler.addFilter(RequestContextFilter(float(os.getenv("LOG_SAMPLE_RATE", 1.0))))
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    # httpx logs every request at INFO, which buries the load and benchmark
+    # harnesses' own output
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    _listener = QueueListener(log_queue, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+def shutdown_logging() -> None:
+    """Drain the queue and stop the writer thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,75 @@
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# Production budget check: log operations that issue more statements (or
+# spend longer in SQL) than allowed
+SQL_BUDGET_LOG = os.getenv("SQL_BUDGET_LOG", "false").lower() == "true"
+SQL_STATEMENT_BUDGET = int(os.getenv("SQL_STATEMENT_BUDGET", 10))
+SQL_TIME_BUDGET_MS = float(os.getenv("SQL_TIME_BUDGET_MS", 250))
+
+class QueryStats:
+    """SQL statements issued within one tracked scope (nested scopes roll up)"""
+
+    def __init__(self, parent: Optional["QueryStats"] = None, capture: bool = False):
+        self.parent = parent
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Optional[List[str]] = [] if capture else None
+
+    def record(self, statement: str, seconds: float) -> None:
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.seconds += seconds
+            if stats.statements is not None:
+                stats.statements.append(statement)
+            stats = stats.parent
+
+query_stats_var: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+@contextmanager
+def track_queries(capture: bool = False) -> Iterator[QueryStats]:
+    """Count (and optionally capture) statements executed in this context"""
+    stats = QueryStats(parent=query_stats_var.get(), capture=capture)
+    token = query_stats_var.set(stats)
+    try:
+        yield stats
+    finally:
+        query_stats_var.reset(token)
+
+def check_budget(operation: str, stats: QueryStats) -> None:
+    if not SQL_BUDGET_LOG:
+        return
+    if stats.count > SQL_STATEMENT_BUDGET or stats.seconds * 1000 > SQL_TIME_BUDGET_MS:
+        logger.warning(
+            "SQL budget exceeded",
+            extra={
+                "operation": operation,
+                "statements": stats.count,
+                "sqlMs": round(stats.seconds * 1000, 3),
+                "statementBudget": SQL_STATEMENT_BUDGET,
+                "timeBudgetMs": SQL_TIME_BUDGET_MS,
+            }
+        )
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_start"] = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = query_stats_var.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - conn.info.get("query_start", time.perf_counter()))
+
+def instrument_engine(engine) -> None:
+    """Attribute statements run on an engine to the current QueryStats scope"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,78 @@
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from app.auth.jwt import get_user_from_token
+from app.database.connection import AsyncSessionLocal
+from app.models.event import Event as EventModel, RegistrationStatus
+from app.services.export import EXPORT_FORMATS, registrations_query
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+def require_user(request: Request) -> dict:
+    user = get_user_from_token(request.headers.get("authorization", ""))
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return user
+
+def export_response(query, format: str, filename: str) -> StreamingResponse:
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported format, expected one of: {', '.join(EXPORT_FORMATS)}"
+        )
+    chunks, media_type = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        chunks(query),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{format}"',
+            # Let reverse proxies pass rows through as they are written
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+@router.get("/events/{event_id}/registrations")
+async def export_event_registrations(
+    event_id: str,
+    request: Request,
+    format: str = "csv",
+    status: Optional[RegistrationStatus] = None
+):
+    """Stream an event's registrations (organizer or SUPER_ADMIN)"""
+    user = require_user(request)
+
+    async with AsyncSessionLocal() as db:
+        organizer_id = await db.scalar(
+            select(EventModel.organizerId).where(EventModel.id == event_id)
+        )
+    if organizer_id is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+    if organizer_id != user['userId'] and user.get('role') != 'SUPER_ADMIN':
+        raise HTTPException(status_code=403, detail="Unauthorized: only the organizer can export registrations")
+
+    return export_response(
+        registrations_query(event_id=event_id, status=status),
+        format,
+        f"registrations-{event_id}"
+    )
+
+@router.get("/registrations")
+async def export_organizer_registrations(
+    request: Request,
+    format: str = "csv",
+    status: Optional[RegistrationStatus] = None,
+    organizerId: Optional[str] = None
+):
+    """Stream registrations across all of the caller's events (SUPER_ADMIN may pick an organizer)"""
+    user = require_user(request)
+
+    organizer_id = organizerId or user['userId']
+    if organizer_id != user['userId'] and user.get('role') != 'SUPER_ADMIN':
+        raise HTTPException(status_code=403, detail="Unauthorized: Super Admin access required")
+
+    return export_response(
+        registrations_query(organizer_id=organizer_id, status=status),
+        format,
+        f"registrations-organizer-{organizer_id}"
+    )
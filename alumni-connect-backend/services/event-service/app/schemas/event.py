@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 
 class EventType(str, Enum):
@@ -14,10 +14,12 @@ class EventType(str, Enum):
 
 class EventStatus(str, Enum):
     DRAFT = "DRAFT"
+    PENDING_APPROVAL = "PENDING_APPROVAL"
     PUBLISHED = "PUBLISHED"
     ONGOING = "ONGOING"
     COMPLETED = "COMPLETED"
     CANCELLED = "CANCELLED"
+    REJECTED = "REJECTED"
 
 class RegistrationStatus(str, Enum):
     REGISTERED = "REGISTERED"
@@ -60,6 +62,45 @@ class UpdateEventInput(BaseModel):
     agenda: Optional[str] = None
     speakers: Optional[str] = None
 
+def to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Timestamp columns are naive UTC"""
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+class ImportEventInput(CreateEventInput):
+    """One event row of a bulk import"""
+    id: Optional[str] = None
+    organizerId: str
+    status: EventStatus = EventStatus.PUBLISHED
+    startDate: datetime
+    endDate: datetime
+    capacity: Optional[int] = Field(default=None, ge=0)
+    price: int = Field(default=0, ge=0)
+    currency: str = "IDR"
+    viewCount: int = Field(default=0, ge=0)
+    createdAt: Optional[datetime] = None
+
+    _naive_utc = field_validator("startDate", "endDate", "createdAt")(to_naive_utc)
+
+    @model_validator(mode="after")
+    def check_dates(self):
+        if self.endDate < self.startDate:
+            raise ValueError("endDate is before startDate")
+        return self
+
+class ImportRegistrationInput(BaseModel):
+    """One registration row of a bulk import"""
+    id: Optional[str] = None
+    eventId: str
+    userId: str
+    status: RegistrationStatus = RegistrationStatus.REGISTERED
+    notes: Optional[str] = None
+    registeredAt: Optional[datetime] = None
+    attendedAt: Optional[datetime] = None
+
+    _naive_utc = field_validator("registeredAt", "attendedAt")(to_naive_utc)
+
 class RegisterEventInput(BaseModel):
     notes: Optional[str] = None
 
@@ -72,5 +113,7 @@ class EventFilterInput(BaseModel):
     upcoming: bool = False
     limit: int = 20
     offset: int = 0
+    after: Optional[str] = None
+    totalCount: str = "EXACT"
     orderBy: str = "startDate"
     order: str = "asc"
\ No newline at end of file
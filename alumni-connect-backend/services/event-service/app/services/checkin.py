@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.auth.checkin import verify_checkin_token
+from app.models.event import (
+    Event as EventModel, Registration as RegistrationModel, RegistrationStatus
+)
+from app.services.registration import ACTIVE_STATUSES
+
+MAX_CHECKIN_BATCH = 1000
+
+@dataclass
+class CheckInOutcome:
+    token: str
+    success: bool
+    registration_id: Optional[str] = None
+    already_checked_in: bool = False
+    attended_at: Optional[datetime] = None
+    message: Optional[str] = None
+
+async def check_in(db: AsyncSession, event_id: str, tokens: List[str]) -> Tuple[List[CheckInOutcome], int]:
+    """Mark the registrations behind a batch of scanned tokens as attended.
+
+    Tokens are verified in memory; all valid ones are checked in with one
+    UPDATE and the event's attendedCount is bumped by the rows it changed.
+    Re-scanning an attended registration succeeds without counting twice.
+    Returns the per-token outcomes and the event's attendedCount. The caller commits.
+    """
+    tokens = list(dict.fromkeys(tokens))
+    if len(tokens) > MAX_CHECKIN_BATCH:
+        raise Exception(f"At most {MAX_CHECKIN_BATCH} tokens can be checked in at once")
+
+    outcomes = []
+    registration_ids = []
+    for token in tokens:
+        verified = verify_checkin_token(token)
+        if verified is None:
+            outcomes.append(CheckInOutcome(token, False, message="Invalid check-in token"))
+        elif verified[1] != event_id:
+            outcomes.append(CheckInOutcome(
+                token, False, verified[0], message="Ticket is for a different event"
+            ))
+        else:
+            outcomes.append(CheckInOutcome(token, False, verified[0]))
+            registration_ids.append(verified[0])
+
+    checked_in = {}
+    if registration_ids:
+        now = datetime.utcnow()
+        checked_in = dict((await db.execute(
+            update(RegistrationModel)
+            .where(
+                RegistrationModel.id.in_(registration_ids),
+                RegistrationModel.eventId == event_id,
+                RegistrationModel.status.in_(ACTIVE_STATUSES)
+            )
+            .values(status=RegistrationStatus.ATTENDED, attendedAt=now, updatedAt=now)
+            .returning(RegistrationModel.id, RegistrationModel.attendedAt)
+            .execution_options(synchronize_session=False)
+        )).all())
+
+    if checked_in:
+        # Concurrent scanners only count the rows their own UPDATE changed,
+        # so the counter stays exact without locking
+        attended_count = await db.scalar(
+            update(EventModel)
+            .where(EventModel.id == event_id)
+            .values(
+                attendedCount=EventModel.attendedCount + len(checked_in),
+                updatedAt=EventModel.updatedAt
+            )
+            .returning(EventModel.attendedCount)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        attended_count = await db.scalar(
+            select(EventModel.attendedCount).where(EventModel.id == event_id)
+        )
+
+    # Explain the valid tokens the UPDATE skipped with one lookup
+    skipped = [registration_id for registration_id in registration_ids if registration_id not in checked_in]
+    current = {}
+    if skipped:
+        current = {
+            row.id: row for row in (await db.execute(
+                select(RegistrationModel.id, RegistrationModel.status, RegistrationModel.attendedAt)
+                .where(RegistrationModel.id.in_(skipped), RegistrationModel.eventId == event_id)
+            )).all()
+        }
+
+    for outcome in outcomes:
+        if outcome.message is not None:
+            continue
+        if outcome.registration_id in checked_in:
+            outcome.success = True
+            outcome.attended_at = checked_in[outcome.registration_id]
+        elif outcome.registration_id not in current:
+            outcome.message = "Registration not found"
+        elif current[outcome.registration_id].status == RegistrationStatus.ATTENDED:
+            outcome.success = True
+            outcome.already_checked_in = True
+            outcome.attended_at = current[outcome.registration_id].attendedAt
+            outcome.message = "Already checked in"
+        else:
+            outcome.message = "Registration is cancelled"
+
+    return outcomes, attended_count or 0
@@ -0,0 +1,94 @@
+import csv
+import enum
+import io
+import json
+import os
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Sequence
+from sqlalchemy import Select, select
+from app.database.connection import AsyncSessionLocal
+from app.models.event import (
+    Event as EventModel, Registration as RegistrationModel, RegistrationStatus
+)
+
+# Rows fetched per round trip from the server-side cursor; memory use is
+# bounded by this, not by the size of the export
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 1000))
+
+EXPORT_COLUMNS = (
+    "registrationId", "eventId", "eventTitle", "userId",
+    "status", "registeredAt", "attendedAt", "notes"
+)
+
+def registrations_query(
+    event_id: Optional[str] = None,
+    organizer_id: Optional[str] = None,
+    status: Optional[RegistrationStatus] = None
+) -> Select:
+    """Registrations of one event, or of every event an organizer runs"""
+    query = (
+        select(
+            RegistrationModel.id,
+            RegistrationModel.eventId,
+            EventModel.title,
+            RegistrationModel.userId,
+            RegistrationModel.status,
+            RegistrationModel.registeredAt,
+            RegistrationModel.attendedAt,
+            RegistrationModel.notes
+        )
+        .join(EventModel, EventModel.id == RegistrationModel.eventId)
+        .order_by(RegistrationModel.eventId, RegistrationModel.registeredAt, RegistrationModel.id)
+    )
+    if event_id:
+        query = query.where(RegistrationModel.eventId == event_id)
+    if organizer_id:
+        query = query.where(EventModel.organizerId == organizer_id)
+    if status:
+        query = query.where(RegistrationModel.status == status)
+    return query
+
+async def stream_rows(query: Select) -> AsyncIterator[List[Sequence]]:
+    """Yield result rows in EXPORT_BATCH_SIZE partitions from a server-side cursor"""
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for partition in result.partitions():
+            yield partition
+
+def _value(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+async def csv_chunks(query: Select) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    # The header goes out before the query runs, so clients see bytes at once
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue()
+
+    async for rows in stream_rows(query):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_value(value) for value in row] for row in rows)
+        yield buffer.getvalue()
+
+async def ndjson_chunks(query: Select) -> AsyncIterator[str]:
+    # NDJSON has no header line, and a leading blank line would break strict
+    # line-by-line parsers. The status line and headers (including
+    # Content-Disposition) are still flushed before the query runs, because
+    # StreamingResponse sends them before it awaits the first chunk
+    async for rows in stream_rows(query):
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, (_value(value) for value in row)))) + "\n"
+            for row in rows
+        )
+
+# format -> (chunk generator, media type)
+EXPORT_FORMATS = {
+    "csv": (csv_chunks, "text/csv; charset=utf-8"),
+    "ndjson": (ndjson_chunks, "application/x-ndjson"),
+}
@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy import String, Text, column, select, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.event import Event as EventModel, EventStatus
+
+MAX_BULK_MODERATION = 500
+
+@dataclass
+class ModerationOutcome:
+    event_id: str
+    success: bool
+    status: Optional[str] = None
+    message: Optional[str] = None
+
+async def _outcomes(db: AsyncSession, event_ids: List[str], updated: set, status: EventStatus) -> List[ModerationOutcome]:
+    """Per-id results in request order; explains ids the UPDATE skipped with one lookup"""
+    skipped = [event_id for event_id in event_ids if event_id not in updated]
+    current: Dict[str, EventStatus] = {}
+    if skipped:
+        current = dict((await db.execute(
+            select(EventModel.id, EventModel.status).where(EventModel.id.in_(skipped))
+        )).all())
+
+    outcomes = []
+    for event_id in event_ids:
+        if event_id in updated:
+            outcomes.append(ModerationOutcome(event_id, True, status.value))
+        elif event_id not in current:
+            outcomes.append(ModerationOutcome(event_id, False, message="Event not found"))
+        else:
+            outcomes.append(ModerationOutcome(
+                event_id, False, current[event_id].value,
+                f"Event is {current[event_id].value}, not pending approval"
+            ))
+    return outcomes
+
+def _unique(event_ids: List[str]) -> List[str]:
+    event_ids = list(dict.fromkeys(event_ids))
+    if len(event_ids) > MAX_BULK_MODERATION:
+        raise Exception(f"At most {MAX_BULK_MODERATION} events can be moderated at once")
+    return event_ids
+
+async def approve_events(db: AsyncSession, event_ids: List[str], admin_id: str) -> List[ModerationOutcome]:
+    """Publish every pending event in one UPDATE. The caller commits."""
+    event_ids = _unique(event_ids)
+    now = datetime.utcnow()
+    updated = set((await db.scalars(
+        update(EventModel)
+        .where(
+            EventModel.id.in_(event_ids),
+            EventModel.status == EventStatus.PENDING_APPROVAL
+        )
+        .values(
+            status=EventStatus.PUBLISHED,
+            approvedBy=admin_id,
+            approvedAt=now,
+            updatedAt=now
+        )
+        .returning(EventModel.id)
+        .execution_options(synchronize_session=False)
+    )).all())
+    return await _outcomes(db, event_ids, updated, EventStatus.PUBLISHED)
+
+async def reject_events(db: AsyncSession, reasons: Dict[str, str], admin_id: str) -> List[ModerationOutcome]:
+    """Reject pending events, each with its own reason, in one UPDATE ... FROM (VALUES ...). The caller commits."""
+    event_ids = _unique(list(reasons))
+    if not event_ids:
+        # An empty VALUES list is not valid SQL
+        return []
+    now = datetime.utcnow()
+    rows = values(
+        column("id", String),
+        column("reason", Text),
+        name="rejections"
+    ).data([(event_id, reasons[event_id]) for event_id in event_ids])
+
+    updated = set((await db.scalars(
+        update(EventModel)
+        .where(
+            EventModel.id == rows.c.id,
+            EventModel.status == EventStatus.PENDING_APPROVAL
+        )
+        .values(
+            status=EventStatus.REJECTED,
+            rejectedBy=admin_id,
+            rejectedAt=now,
+            rejectionReason=rows.c.reason,
+            updatedAt=now
+        )
+        .returning(EventModel.id)
+        .execution_options(synchronize_session=False)
+    )).all())
+    return await _outcomes(db, event_ids, updated, EventStatus.REJECTED)
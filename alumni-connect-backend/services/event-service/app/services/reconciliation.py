@@ -0,0 +1,60 @@
+from typing import List, Optional
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.event import (
+    Event as EventModel, Registration as RegistrationModel, RegistrationStatus
+)
+
+def active_registrations():
+    """Grouped count of non-cancelled registrations per event"""
+    return select(
+        RegistrationModel.eventId,
+        func.count(RegistrationModel.id).label("active")
+    ).where(
+        RegistrationModel.status != RegistrationStatus.CANCELLED
+    ).group_by(RegistrationModel.eventId).subquery()
+
+async def reconcile_attendee_counts(
+    db: AsyncSession,
+    event_ids: Optional[List[str]] = None,
+    dry_run: bool = False
+) -> List[dict]:
+    """Find events whose currentAttendees drifted from their registrations and fix them"""
+    counts = active_registrations()
+    actual = func.coalesce(counts.c.active, 0)
+
+    query = select(
+        EventModel.id,
+        EventModel.currentAttendees,
+        actual.label("actual")
+    ).outerjoin(
+        counts, counts.c.eventId == EventModel.id
+    ).where(
+        EventModel.currentAttendees.is_distinct_from(actual)
+    )
+    if event_ids:
+        query = query.where(EventModel.id.in_(event_ids))
+
+    drift = [
+        {"eventId": event_id, "counter": counter, "actual": active}
+        for event_id, counter, active in (await db.execute(query)).all()
+    ]
+    if dry_run or not drift:
+        return drift
+
+    # Recount inside the UPDATE itself so registrations made since the scan are included
+    recount = func.coalesce(
+        select(func.count(RegistrationModel.id)).where(
+            RegistrationModel.eventId == EventModel.id,
+            RegistrationModel.status != RegistrationStatus.CANCELLED
+        ).scalar_subquery(),
+        0
+    )
+    await db.execute(
+        update(EventModel)
+        .where(EventModel.id.in_([row["eventId"] for row in drift]))
+        .values(currentAttendees=recount, updatedAt=EventModel.updatedAt)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return drift
@@ -0,0 +1,123 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.event import (
+    Event as EventModel, Registration as RegistrationModel, RegistrationStatus
+)
+
+ACTIVE_STATUSES = (RegistrationStatus.REGISTERED, RegistrationStatus.CONFIRMED)
+
+async def _raise_unavailable(db: AsyncSession, event_id: str, now: datetime) -> None:
+    """Explain why a seat could not be reserved (only runs on the failure path)"""
+    event = await db.get(EventModel, event_id)
+    if not event:
+        raise Exception("Event not found")
+    if event.status != 'PUBLISHED':
+        raise Exception("Event is not available for registration")
+    if now > event.startDate:
+        raise Exception("Event has already started")
+    raise Exception("Event is full")
+
+async def reserve_seat(
+    db: AsyncSession,
+    event_id: str,
+    user_id: str,
+    notes: Optional[str] = None
+) -> RegistrationModel:
+    """Atomically take a seat and create (or reactivate) a registration. The caller commits."""
+    now = datetime.utcnow()
+
+    # Conditional UPDATE: concurrent requests serialize on the event row and
+    # can never push currentAttendees past capacity
+    reserved = await db.scalar(
+        update(EventModel)
+        .where(
+            EventModel.id == event_id,
+            EventModel.status == 'PUBLISHED',
+            EventModel.startDate > now,
+            or_(
+                EventModel.capacity.is_(None),
+                EventModel.currentAttendees < EventModel.capacity
+            )
+        )
+        .values(
+            currentAttendees=EventModel.currentAttendees + 1,
+            updatedAt=EventModel.updatedAt
+        )
+        .returning(EventModel.id)
+        .execution_options(synchronize_session=False)
+    )
+    if reserved is None:
+        await _raise_unavailable(db, event_id, now)
+
+    stmt = insert(RegistrationModel).values(
+        id=str(uuid.uuid4()),
+        eventId=event_id,
+        userId=user_id,
+        notes=notes,
+        status=RegistrationStatus.REGISTERED,
+        registeredAt=now,
+        updatedAt=now
+    )
+    # The (eventId, userId) unique index catches duplicates: a cancelled
+    # registration is reactivated, an active one returns no row and the
+    # caller's rollback releases the seat again
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[RegistrationModel.eventId, RegistrationModel.userId],
+        set_={
+            "status": RegistrationStatus.REGISTERED,
+            "notes": stmt.excluded.notes,
+            "attendedAt": None,
+            "registeredAt": stmt.excluded.registeredAt,
+            "updatedAt": stmt.excluded.updatedAt,
+        },
+        where=RegistrationModel.status == RegistrationStatus.CANCELLED
+    )
+
+    registration = await db.scalar(
+        select(RegistrationModel).from_statement(stmt.returning(RegistrationModel))
+    )
+    if registration is None:
+        raise Exception("You have already registered for this event")
+
+    return registration
+
+async def release_seat(db: AsyncSession, event_id: str, user_id: str) -> None:
+    """Cancel an active registration and give its seat back. The caller commits."""
+    cancelled = await db.scalar(
+        update(RegistrationModel)
+        .where(
+            RegistrationModel.eventId == event_id,
+            RegistrationModel.userId == user_id,
+            RegistrationModel.status.in_(ACTIVE_STATUSES)
+        )
+        .values(status=RegistrationStatus.CANCELLED, updatedAt=datetime.utcnow())
+        .returning(RegistrationModel.id)
+        .execution_options(synchronize_session=False)
+    )
+
+    if cancelled is None:
+        status = await db.scalar(
+            select(RegistrationModel.status).where(
+                RegistrationModel.eventId == event_id,
+                RegistrationModel.userId == user_id
+            )
+        )
+        if status is None:
+            raise Exception("Registration not found")
+        if status == RegistrationStatus.ATTENDED:
+            raise Exception("Cannot cancel after attending")
+        raise Exception("Registration is already cancelled")
+
+    await db.execute(
+        update(EventModel)
+        .where(EventModel.id == event_id)
+        .values(
+            currentAttendees=func.greatest(EventModel.currentAttendees - 1, 0),
+            updatedAt=EventModel.updatedAt
+        )
+        .execution_options(synchronize_session=False)
+    )
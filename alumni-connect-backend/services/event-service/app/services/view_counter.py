@@ -0,0 +1,84 @@
+import asyncio
+import logging
+import os
+from collections import Counter
+from typing import Optional
+from sqlalchemy import Integer, String, column, update, values
+from app.database.connection import AsyncSessionLocal
+from app.models.event import Event as EventModel
+
+logger = logging.getLogger(__name__)
+
+class ViewCounterBuffer:
+    """Aggregate event view increments in memory and write them back in batches"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._pending: Counter = Counter()
+        self._task: Optional[asyncio.Task] = None
+
+    def increment(self, event_id: str) -> None:
+        self._pending[event_id] += 1
+
+    def pending(self, event_id: str) -> int:
+        """Views recorded but not yet flushed to the database"""
+        return self._pending.get(event_id, 0)
+
+    async def flush(self) -> int:
+        """Apply all buffered increments with one set-based UPDATE"""
+        if not self._pending:
+            return 0
+
+        batch, self._pending = self._pending, Counter()
+        rows = values(
+            column("id", String),
+            column("views", Integer),
+            name="view_counts"
+        ).data(list(batch.items()))
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(EventModel)
+                    .where(EventModel.id == rows.c.id)
+                    .values(
+                        viewCount=EventModel.viewCount + rows.c.views,
+                        # A page view is not an edit
+                        updatedAt=EventModel.updatedAt
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+        except Exception:
+            # Keep the increments for the next attempt
+            self._pending.update(batch)
+            raise
+
+        return len(batch)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("View count flush failed")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and write out whatever is left"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+view_counter = ViewCounterBuffer(
+    interval=float(os.getenv("VIEW_COUNT_FLUSH_INTERVAL", 5))
+)
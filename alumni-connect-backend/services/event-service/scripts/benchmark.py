@@ -0,0 +1,332 @@
+"""
+Benchmark suite for the event-service hot paths
+Seeds a local Postgres at a configurable scale, drives the FastAPI app
+in-process through an ASGI client and reports throughput and latency
+percentiles per scenario. Results are written as JSON; pass --compare to
+diff against an earlier run.
+
+Usage:
+    python -m scripts.benchmark --events 5000 --users 500 --requests 500
+    python -m scripts.benchmark --scenarios event_detail search --output before.json
+    python -m scripts.benchmark --compare before.json --output after.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import subprocess
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import delete, insert, select
+from app.database.connection import SessionLocal
+from app.models.event import (
+    Event, EventStatus, EventType, Registration, RegistrationStatus
+)
+from scripts.common import delete_users, ensure_users, graphql, graphql_client, make_token
+
+WORDS = [
+    "alumni", "reunion", "career", "startup", "workshop", "python", "design",
+    "mentoring", "networking", "research", "finance", "leadership", "data",
+    "marketing", "engineering", "health", "music", "sports", "charity", "ai",
+]
+LOCATIONS = ["Bandung", "Jakarta", "Surabaya", "Yogyakarta", "Online"]
+
+EVENT_FIELDS = "id title type status startDate location registrationsCount isFull percentage daysLeft"
+
+EVENTS_QUERY = """
+query Events($offset: Int!) {
+  events(filter: { limit: 20, offset: $offset }) {
+    events { %s hasRegistered registrationStatus }
+    pagination { total hasMore }
+  }
+}
+""" % EVENT_FIELDS
+
+EVENT_QUERY = """
+query Event($id: ID!) { event(id: $id) { %s description viewCount hasRegistered } }
+""" % EVENT_FIELDS
+
+SEARCH_QUERY = """
+query Search($query: String!) {
+  searchEvents(query: $query, filter: { limit: 20 }) {
+    results { rank headline event { id title } }
+    pagination { total hasMore }
+  }
+}
+"""
+
+MY_REGISTRATIONS_QUERY = """
+query MyRegistrations { myRegistrations { id status event { %s } } }
+""" % EVENT_FIELDS
+
+REGISTER_MUTATION = """
+mutation Register($eventId: ID!) { registerEvent(eventId: $eventId) { id status } }
+"""
+
+SCENARIOS = [
+    "events_anonymous", "events_authenticated", "event_detail",
+    "search", "my_registrations", "register_event",
+]
+
+class Dataset:
+    def __init__(self, run_id: str, organizer_id: str, user_ids: List[str],
+                 event_ids: List[str], registered: set):
+        self.run_id = run_id
+        self.organizer_id = organizer_id
+        self.user_ids = user_ids
+        self.event_ids = event_ids
+        self.registered = registered
+
+def seed(args, rng: random.Random) -> Dataset:
+    """Bulk-insert events, users and registrations for one run"""
+    run_id = uuid.uuid4().hex[:8]
+    organizer_id = f"bench-{run_id}-organizer"
+    user_ids = [f"bench-{run_id}-{i}" for i in range(args.users)]
+    now = datetime.utcnow()
+
+    events = []
+    for i in range(args.events):
+        words = rng.sample(WORDS, 3)
+        start = now + timedelta(days=rng.randint(1, 365), hours=rng.randint(0, 23))
+        events.append({
+            "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            "organizerId": organizer_id,
+            "title": f"{words[0].title()} {words[1]} meetup #{i}",
+            "description": f"Benchmark event about {' and '.join(words)} for run {run_id}",
+            "type": rng.choice(list(EventType)),
+            "status": EventStatus.PUBLISHED,
+            "startDate": start,
+            "endDate": start + timedelta(hours=rng.randint(1, 6)),
+            "location": rng.choice(LOCATIONS),
+            "isOnline": rng.random() < 0.3,
+            "capacity": args.users + args.requests,
+            "currentAttendees": 0,
+            "tags": words,
+            "viewCount": 0,
+            "createdAt": now,
+            "updatedAt": now,
+        })
+
+    registered = set()
+    attendees: Dict[str, int] = {}
+    registrations = []
+    for user_id in user_ids:
+        for event in rng.sample(events, min(args.registrations, len(events))):
+            registered.add((user_id, event["id"]))
+            attendees[event["id"]] = attendees.get(event["id"], 0) + 1
+            registrations.append({
+                "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                "eventId": event["id"],
+                "userId": user_id,
+                "status": RegistrationStatus.REGISTERED,
+                "registeredAt": now,
+                "updatedAt": now,
+            })
+    for event in events:
+        event["currentAttendees"] = attendees.get(event["id"], 0)
+
+    db = SessionLocal()
+    try:
+        ensure_users(db, [organizer_id, *user_ids])
+        for start in range(0, len(events), args.batch_size):
+            db.execute(insert(Event), events[start:start + args.batch_size])
+        for start in range(0, len(registrations), args.batch_size):
+            db.execute(insert(Registration), registrations[start:start + args.batch_size])
+        db.commit()
+    finally:
+        db.close()
+
+    return Dataset(run_id, organizer_id, user_ids, [event["id"] for event in events], registered)
+
+def cleanup(dataset: Dataset) -> None:
+    db = SessionLocal()
+    try:
+        event_ids = select(Event.id).where(Event.organizerId == dataset.organizer_id)
+        db.execute(delete(Registration).where(Registration.eventId.in_(event_ids)))
+        db.execute(delete(Event).where(Event.organizerId == dataset.organizer_id))
+        delete_users(db, [dataset.organizer_id, *dataset.user_ids])
+        db.commit()
+    finally:
+        db.close()
+
+def build_requests(name: str, args, dataset: Dataset, rng: random.Random) -> List[Tuple[str, dict, Optional[str]]]:
+    """(query, variables, token) for every request of one scenario"""
+    tokens = {}
+
+    def token_for(user_id: str) -> str:
+        if user_id not in tokens:
+            tokens[user_id] = make_token(user_id)
+        return tokens[user_id]
+
+    pages = max(1, min(len(dataset.event_ids) // 20, 50))
+    requests = []
+    if name == "register_event":
+        # Only (user, event) pairs that are not registered yet, so every request books a seat
+        available = len(dataset.user_ids) * len(dataset.event_ids) - len(dataset.registered)
+        while len(requests) < min(args.requests, available):
+            user_id, event_id = rng.choice(dataset.user_ids), rng.choice(dataset.event_ids)
+            if (user_id, event_id) not in dataset.registered:
+                dataset.registered.add((user_id, event_id))
+                requests.append((REGISTER_MUTATION, {"eventId": event_id}, token_for(user_id)))
+        return requests
+
+    for _ in range(args.requests):
+        user_id = rng.choice(dataset.user_ids)
+        if name == "events_anonymous":
+            requests.append((EVENTS_QUERY, {"offset": rng.randrange(pages) * 20}, None))
+        elif name == "events_authenticated":
+            requests.append((EVENTS_QUERY, {"offset": rng.randrange(pages) * 20}, token_for(user_id)))
+        elif name == "event_detail":
+            requests.append((EVENT_QUERY, {"id": rng.choice(dataset.event_ids)}, token_for(user_id)))
+        elif name == "search":
+            query = " ".join(rng.sample(WORDS, rng.choice((1, 2))))
+            requests.append((SEARCH_QUERY, {"query": query}, None))
+        elif name == "my_registrations":
+            requests.append((MY_REGISTRATIONS_QUERY, None, token_for(user_id)))
+    return requests
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted samples"""
+    if not samples:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(samples)))
+    return samples[rank - 1]
+
+def summarize(latencies: List[float], errors: Dict[str, int], elapsed: float) -> dict:
+    samples = sorted(latency * 1000 for latency in latencies)
+    total = len(samples)
+    return {
+        "requests": total,
+        "errors": sum(errors.values()),
+        "errorMessages": errors,
+        "elapsedSeconds": round(elapsed, 3),
+        "throughput": round(total / elapsed, 2) if elapsed else 0.0,
+        "latencyMs": {
+            "mean": round(sum(samples) / total, 3) if total else 0.0,
+            "min": round(samples[0], 3) if total else 0.0,
+            "p50": round(percentile(samples, 50), 3),
+            "p95": round(percentile(samples, 95), 3),
+            "p99": round(percentile(samples, 99), 3),
+            "max": round(samples[-1], 3) if total else 0.0,
+        },
+    }
+
+async def run_scenario(client, requests: list, concurrency: int, warmup: int) -> dict:
+    for query, variables, token in requests[:warmup]:
+        await graphql(client, query, variables, token)
+    requests = requests[warmup:]
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+
+    async def send(query: str, variables: dict, token: Optional[str]):
+        async with semaphore:
+            start = time.perf_counter()
+            body = await graphql(client, query, variables, token)
+            latencies.append(time.perf_counter() - start)
+        if body.get("errors"):
+            message = body["errors"][0]["message"]
+            errors[message] = errors.get(message, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(*request) for request in requests))
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+async def run_benchmarks(args, dataset: Dataset) -> dict:
+    results = {}
+    async with graphql_client() as client:
+        for name in args.scenarios:
+            # A fresh generator per scenario keeps each workload reproducible on its own
+            rng = random.Random(f"{args.seed}:{name}")
+            requests = build_requests(name, args, dataset, rng)
+            warmup = 0 if name == "register_event" else min(args.warmup, len(requests))
+            results[name] = await run_scenario(client, requests, args.concurrency, warmup)
+            latency = results[name]["latencyMs"]
+            print(
+                f"📈 {name:<22} {results[name]['throughput']:>9.1f} req/s  "
+                f"p50 {latency['p50']:>8.2f}ms  p95 {latency['p95']:>8.2f}ms  "
+                f"p99 {latency['p99']:>8.2f}ms  errors {results[name]['errors']}"
+            )
+    return results
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results: dict, baseline_path: str) -> None:
+    with open(baseline_path) as f:
+        baseline = json.load(f)["scenarios"]
+
+    print(f"\n🔁 Compared with {baseline_path}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        deltas: List[str] = []
+        for label, get in (
+            ("req/s", lambda r: r["throughput"]),
+            ("p50", lambda r: r["latencyMs"]["p50"]),
+            ("p99", lambda r: r["latencyMs"]["p99"]),
+        ):
+            before, after = get(previous), get(current)
+            change = (after - before) / before * 100 if before else 0.0
+            deltas.append(f"{label} {before:.2f} → {after:.2f} ({change:+.1f}%)")
+        print(f"   {name:<22} " + "  ".join(deltas))
+
+def main():
+    parser = argparse.ArgumentParser(description="event-service benchmark suite")
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--registrations", type=int, default=10, help="registrations per user")
+    parser.add_argument("--requests", type=int, default=300, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=20, help="untimed requests per scenario")
+    parser.add_argument("--batch-size", type=int, default=1000, help="rows per seed INSERT")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for data and workload")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--output", help="JSON result path (default: benchmark-<timestamp>.json)")
+    parser.add_argument("--compare", help="earlier JSON result to diff against")
+    parser.add_argument("--keep", action="store_true", help="keep the seeded data")
+    args = parser.parse_args()
+
+    started_at = datetime.utcnow()
+    print(f"🌱 Seeding {args.events} events, {args.users} users, {args.registrations} registrations/user")
+    seed_start = time.perf_counter()
+    dataset = seed(args, random.Random(args.seed))
+    seed_seconds = time.perf_counter() - seed_start
+
+    try:
+        results = asyncio.run(run_benchmarks(args, dataset))
+    finally:
+        if not args.keep:
+            cleanup(dataset)
+
+    report = {
+        "startedAt": started_at.isoformat() + "Z",
+        "revision": git_revision(),
+        "config": {
+            key: getattr(args, key)
+            for key in ("events", "users", "registrations", "requests", "concurrency", "warmup", "seed")
+        },
+        "seedSeconds": round(seed_seconds, 3),
+        "scenarios": results,
+    }
+    output = args.output or f"benchmark-{started_at.strftime('%Y%m%d-%H%M%S')}.json"
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"💾 Results written to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
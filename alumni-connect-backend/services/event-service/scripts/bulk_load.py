@@ -0,0 +1,286 @@
+"""
+Set-based bulk loading into identity_schema for the import and data scripts
+Each batch is COPYed (or multi-row INSERTed) into a session-local staging
+table and moved into the real table with one INSERT ... SELECT ... ON CONFLICT,
+so duplicates, conflicts and dangling references are resolved in SQL rather
+than row by row. Use one Connection for the whole load: the staging tables
+are temporary and live as long as it does.
+"""
+import enum
+import io
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from psycopg2.extras import execute_values
+from sqlalchemy import ARRAY, Boolean, DateTime, text
+from sqlalchemy.engine import Connection
+from app.models.event import Event, JSONText, Registration
+
+EVENT_COLUMNS = (
+    "id", "organizerId", "title", "description", "type", "status", "coverImage",
+    "startDate", "endDate", "location", "isOnline", "meetingUrl", "capacity",
+    "price", "currency", "tags", "requirements", "agenda", "speakers",
+    "viewCount", "createdAt", "updatedAt",
+)
+# Derived from registrations (see recount_staged_events) unless a loader sets them
+COUNTER_COLUMNS = ("currentAttendees", "attendedCount")
+REGISTRATION_COLUMNS = (
+    "id", "eventId", "userId", "status", "notes", "attendedAt", "registeredAt", "updatedAt",
+)
+
+CONFLICT_MODES = ("skip", "update")
+LOAD_METHODS = ("copy", "insert")
+
+@dataclass
+class LoadStats:
+    rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+    batches: int = 0
+
+    @property
+    def skipped(self) -> int:
+        return self.rows - self.inserted - self.updated - self.rejected
+
+    @property
+    def throughput(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def summary(self, label: str) -> str:
+        return (
+            f"{label}: {self.rows} rows, {self.inserted} inserted, {self.updated} updated, "
+            f"{self.rejected} rejected, {self.skipped} skipped in {self.seconds:.2f}s ({self.throughput:,.0f} rows/s)"
+        )
+
+def _array_literal(items: Sequence[str]) -> str:
+    escaped = (str(item).replace("\\", "\\\\").replace('"', '\\"') for item in items)
+    return "{" + ",".join(f'"{item}"' for item in escaped) + "}"
+
+def _json_text(value) -> str:
+    # Same rule as JSONText: JSON documents pass through, plain text becomes a JSON string
+    if isinstance(value, str):
+        try:
+            json.loads(value)
+            return value
+        except ValueError:
+            return json.dumps(value)
+    return json.dumps(value)
+
+def _copy_field(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+class StagedTable:
+    """Load batches of rows into one table through a temporary staging table
+
+    references are (column, condition) pairs: staged rows failing a condition
+    are not merged, and after each batch `rejected` lists their unique key
+    and the column whose reference is missing.
+    """
+
+    def __init__(
+        self,
+        conn: Connection,
+        model,
+        columns: Sequence[str],
+        unique: Sequence[str],
+        conflict: str = "skip",
+        method: str = "copy",
+        references: Sequence[Tuple[str, str]] = (),
+    ):
+        self.conn = conn
+        self.columns = list(columns)
+        self.unique = list(unique)
+        self.conflict = conflict
+        self.method = method
+        self.references = list(references)
+        self.where = " AND ".join(condition for _, condition in self.references) or None
+        self.rejected: List[Tuple[Tuple[str, ...], str]] = []
+        self.target = f'identity_schema."{model.__tablename__}"'
+        self.staging = f"{model.__tablename__.lower()}_import"
+        self.kinds = [self._kind(model.__table__.columns[name].type) for name in self.columns]
+        self.stats = LoadStats()
+
+        # Same column types as the target, but no constraints, indexes or generated columns
+        conn.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {self.staging} AS "
+            f"SELECT {self._column_list()} FROM {self.target} WITH NO DATA"
+        ))
+
+    @staticmethod
+    def _kind(column_type) -> str:
+        if isinstance(column_type, ARRAY):
+            return "array"
+        if isinstance(column_type, JSONText):
+            return "json"
+        if isinstance(column_type, Boolean):
+            return "bool"
+        if isinstance(column_type, DateTime):
+            return "datetime"
+        return "scalar"
+
+    def _column_list(self, alias: str = "") -> str:
+        return ", ".join(f'{alias}"{name}"' for name in self.columns)
+
+    def _value(self, value, kind: str):
+        """Python value as the text Postgres parses for the staging column"""
+        if value is None:
+            return None
+        if isinstance(value, enum.Enum):
+            value = value.value
+        if kind == "array":
+            return _array_literal(value)
+        if kind == "json":
+            return _json_text(value)
+        if kind == "bool":
+            return "t" if value else "f"
+        if kind == "datetime" and isinstance(value, datetime):
+            return value.isoformat()
+        return str(value)
+
+    def _encode(self, rows: Iterable[Dict]) -> List[List[Optional[str]]]:
+        return [
+            [self._value(row.get(name), kind) for name, kind in zip(self.columns, self.kinds)]
+            for row in rows
+        ]
+
+    def _fill_staging(self, values: List[List[Optional[str]]]) -> None:
+        cursor = self.conn.connection.cursor()
+        try:
+            if self.method == "copy":
+                buffer = io.StringIO()
+                for row in values:
+                    buffer.write("\t".join("\\N" if value is None else _copy_field(value) for value in row))
+                    buffer.write("\n")
+                buffer.seek(0)
+                cursor.copy_expert(f"COPY {self.staging} ({self._column_list()}) FROM STDIN", buffer)
+            else:
+                execute_values(
+                    cursor,
+                    f"INSERT INTO {self.staging} ({self._column_list()}) VALUES %s",
+                    values,
+                    page_size=len(values)
+                )
+        finally:
+            cursor.close()
+
+    def _merge_sql(self) -> str:
+        unique = ", ".join(f'"{name}"' for name in self.unique)
+        if self.conflict == "update":
+            assignments = ", ".join(
+                f'"{name}" = EXCLUDED."{name}"'
+                for name in self.columns
+                if name not in self.unique and name != "id"
+            )
+            on_conflict = f"ON CONFLICT ({unique}) DO UPDATE SET {assignments}"
+        else:
+            # No target: rows clashing with any unique index are skipped
+            on_conflict = "ON CONFLICT DO NOTHING"
+
+        # DISTINCT ON keeps the last occurrence of a key within the batch, so
+        # an upsert never touches the same row twice in one statement
+        return f"""
+            WITH written AS (
+                INSERT INTO {self.target} ({self._column_list()})
+                SELECT DISTINCT ON ({self._unique_list('s.')}) {self._column_list('s.')}
+                FROM {self.staging} s
+                {f"WHERE {self.where}" if self.where else ""}
+                ORDER BY {self._unique_list('s.')}, s.ctid DESC
+                {on_conflict}
+                RETURNING (xmax = 0) AS inserted
+            )
+            SELECT
+                count(*) FILTER (WHERE inserted) AS inserted,
+                count(*) FILTER (WHERE NOT inserted) AS updated
+            FROM written
+        """
+
+    def _unique_list(self, alias: str) -> str:
+        return ", ".join(f'{alias}"{name}"' for name in self.unique)
+
+    def _rejected_sql(self) -> str:
+        key = ", ".join(f'CAST(s."{name}" AS text)' for name in self.unique)
+        reason = " ".join(
+            f"WHEN NOT ({condition}) THEN '{column}'" for column, condition in self.references
+        )
+        return f"SELECT {key}, CASE {reason} END FROM {self.staging} s WHERE NOT ({self.where})"
+
+    def load(self, rows: List[Dict]) -> None:
+        """Stage and merge one batch. The caller commits."""
+        self.rejected = []
+        if not rows:
+            return
+        start = time.perf_counter()
+        self.conn.execute(text(f"TRUNCATE {self.staging}"))
+        self._fill_staging(self._encode(rows))
+        inserted, updated = self.conn.execute(text(self._merge_sql())).one()
+        if self.where and inserted + updated < len(rows):
+            # Only look for dangling references when some rows were held back
+            self.rejected = [
+                (tuple(row[:-1]), row[-1])
+                for row in self.conn.execute(text(self._rejected_sql())).all()
+            ]
+
+        self.stats.rows += len(rows)
+        self.stats.inserted += inserted
+        self.stats.updated += updated
+        self.stats.rejected += len(self.rejected)
+        self.stats.batches += 1
+        self.stats.seconds += time.perf_counter() - start
+
+def has_users_table(conn: Connection) -> bool:
+    return conn.execute(text("SELECT to_regclass('identity_schema.users')")).scalar() is not None
+
+def event_loader(
+    conn: Connection,
+    conflict: str = "skip",
+    method: str = "copy",
+    columns: Sequence[str] = EVENT_COLUMNS
+) -> StagedTable:
+    """Events keyed by id; rows whose organizer does not exist are rejected"""
+    references = []
+    if has_users_table(conn):
+        references.append((
+            "organizerId",
+            'EXISTS (SELECT 1 FROM identity_schema.users u WHERE u.id = s."organizerId")'
+        ))
+    return StagedTable(conn, Event, columns, ["id"], conflict, method, references)
+
+def registration_loader(conn: Connection, conflict: str = "skip", method: str = "copy") -> StagedTable:
+    """Registrations keyed by (eventId, userId); rows for unknown events or users are rejected"""
+    references = [
+        ("eventId", 'EXISTS (SELECT 1 FROM identity_schema."Event" e WHERE e.id = s."eventId")')
+    ]
+    if has_users_table(conn):
+        references.append((
+            "userId",
+            'EXISTS (SELECT 1 FROM identity_schema.users u WHERE u.id = s."userId")'
+        ))
+    return StagedTable(
+        conn, Registration, REGISTRATION_COLUMNS, ["eventId", "userId"], conflict, method,
+        references
+    )
+
+def recount_staged_events(conn: Connection, loader: StagedTable) -> None:
+    """Refresh seat and attendance counters for the events in the last registration batch"""
+    conn.execute(text(f"""
+        UPDATE identity_schema."Event" e
+        SET "currentAttendees" = c.active, "attendedCount" = c.attended
+        FROM (
+            SELECT r."eventId",
+                   count(*) FILTER (WHERE r.status <> 'CANCELLED') AS active,
+                   count(*) FILTER (WHERE r.status = 'ATTENDED') AS attended
+            FROM identity_schema."Registration" r
+            WHERE r."eventId" IN (SELECT DISTINCT "eventId" FROM {loader.staging})
+            GROUP BY r."eventId"
+        ) c
+        WHERE c."eventId" = e.id
+    """))
+
+def analyze(conn: Connection) -> None:
+    """Refresh planner statistics after a large load"""
+    conn.execute(text('ANALYZE identity_schema."Event"'))
+    conn.execute(text('ANALYZE identity_schema."Registration"'))
@@ -0,0 +1,70 @@
+"""
+Shared helpers for the event-service maintenance and load scripts
+Run scripts from the service root, e.g. `python -m scripts.load_register`
+"""
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+import httpx
+from jose import jwt
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.auth.jwt import JWT_SECRET, ALGORITHM
+
+def make_token(user_id: str, role: str = "ALUMNI") -> str:
+    """Sign a JWT the same way the identity service does"""
+    payload = {
+        "userId": user_id,
+        "email": f"{user_id}@loadtest.local",
+        "role": role,
+        "exp": datetime.utcnow() + timedelta(days=1),
+    }
+    return jwt.encode(payload, JWT_SECRET, algorithm=ALGORITHM)
+
+def has_users_table(db: Session) -> bool:
+    """The shared Prisma database has identity_schema.users with FKs to it"""
+    return db.execute(text("SELECT to_regclass('identity_schema.users')")).scalar() is not None
+
+def ensure_users(db: Session, user_ids: Iterable[str]) -> None:
+    """Create placeholder users so Event/Registration foreign keys are satisfied"""
+    user_ids = list(user_ids)
+    if not user_ids or not has_users_table(db):
+        return
+    db.execute(
+        text("""
+            INSERT INTO identity_schema.users (id, email, password, status, "updatedAt")
+            SELECT id, id || '@loadtest.local', '!', 'ACTIVE', now()
+            FROM unnest(CAST(:ids AS text[])) AS id
+            ON CONFLICT (id) DO NOTHING
+        """),
+        {"ids": user_ids}
+    )
+
+def delete_users(db: Session, user_ids: Iterable[str]) -> None:
+    user_ids = list(user_ids)
+    if not user_ids or not has_users_table(db):
+        return
+    db.execute(
+        text("DELETE FROM identity_schema.users WHERE id = ANY(CAST(:ids AS text[]))"),
+        {"ids": user_ids}
+    )
+
+def graphql_client(url: Optional[str] = None, timeout: float = 60.0) -> httpx.AsyncClient:
+    """Client for a running service, or for the FastAPI app in-process when url is None"""
+    if url:
+        return httpx.AsyncClient(base_url=url, timeout=timeout)
+
+    from app.main import app
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://event-service",
+        timeout=timeout
+    )
+
+async def graphql(client: httpx.AsyncClient, query: str, variables: Optional[dict] = None, token: Optional[str] = None) -> dict:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    response = await client.post(
+        "/graphql",
+        json={"query": query, "variables": variables or {}},
+        headers=headers
+    )
+    return response.json()
@@ -0,0 +1,286 @@
+"""
+Synthetic events and registrations for load and capacity testing
+Generates any number of events with realistic shape: Zipf-skewed popularity
+and tag use, dates spread over past and future, every EventType and
+EventStatus, capacity limits and cancellations. Output is fully
+deterministic for a given --seed and --anchor: every event draws from its
+own seeded generator, so chunks are produced (and loaded) one at a time and
+memory stays flat at any scale. Chunks are bulk-loaded through COPY (see
+scripts/bulk_load.py) or written as NDJSON that scripts.import_events accepts.
+
+Usage:
+    python -m scripts.generate_data --events 1000000 --users 200000
+    python -m scripts.generate_data --events 50000 --seed 7 --clean
+    python -m scripts.generate_data --events 10000 --output ./synthetic
+"""
+import argparse
+import json
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Tuple
+from sqlalchemy import text
+from app.database.connection import engine
+from app.models.event import EventStatus, EventType, RegistrationStatus
+from scripts.bulk_load import (
+    COUNTER_COLUMNS, EVENT_COLUMNS, LOAD_METHODS, LoadStats, analyze,
+    event_loader, has_users_table, registration_loader
+)
+from scripts.common import ensure_users
+
+TAGS = [
+    "networking", "career", "alumni", "technology", "startup", "ai", "data",
+    "leadership", "design", "finance", "marketing", "engineering", "research",
+    "mentoring", "health", "entrepreneurship", "cloud", "security", "product",
+    "sports", "music", "charity", "bandung", "jakarta", "reunion", "workshop",
+    "scholarship", "government", "education", "sustainability",
+]
+TITLE_WORDS = {
+    EventType.WEBINAR: "Webinar", EventType.WORKSHOP: "Workshop", EventType.MEETUP: "Meetup",
+    EventType.REUNION: "Reunion", EventType.SEMINAR: "Seminar",
+    EventType.NETWORKING: "Networking Night", EventType.CONFERENCE: "Conference",
+}
+# Share of events per type; reunions and conferences are rare but large
+TYPE_WEIGHTS = {
+    EventType.WEBINAR: 30, EventType.WORKSHOP: 20, EventType.MEETUP: 20,
+    EventType.SEMINAR: 12, EventType.NETWORKING: 10, EventType.REUNION: 5,
+    EventType.CONFERENCE: 3,
+}
+TYPE_SCALE = {
+    EventType.WEBINAR: 2.0, EventType.WORKSHOP: 0.5, EventType.MEETUP: 0.6,
+    EventType.SEMINAR: 1.0, EventType.NETWORKING: 0.8, EventType.REUNION: 3.0,
+    EventType.CONFERENCE: 4.0,
+}
+LOCATIONS = ["Bandung", "Jakarta", "Surabaya", "Yogyakarta", "Semarang", "Medan", "Makassar", "Denpasar"]
+CAPACITIES = [20, 30, 50, 100, 150, 200, 300, 500, 1000, 2000]
+
+# Zipf weights: the most common tags and users dominate, the tail stays long
+TAG_WEIGHTS = [1 / rank for rank in range(1, len(TAGS) + 1)]
+
+def random_id(rng: random.Random) -> str:
+    """uuid.UUID(int=..., version=4) without the object overhead (ids dominate generation time)"""
+    value = rng.getrandbits(128)
+    value = (value & ~(0xc000 << 48) | 0x8000 << 48) & ~(0xf000 << 64) | 4 << 76
+    digits = f"{value:032x}"
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
+def pick_status(rng: random.Random, start: datetime, end: datetime, anchor: datetime) -> EventStatus:
+    """Lifecycle status consistent with where the event sits relative to the anchor"""
+    if end < anchor:
+        return EventStatus.CANCELLED if rng.random() < 0.05 else EventStatus.COMPLETED
+    if start <= anchor:
+        return EventStatus.ONGOING
+    roll = rng.random()
+    if roll < 0.75:
+        return EventStatus.PUBLISHED
+    if roll < 0.85:
+        return EventStatus.PENDING_APPROVAL
+    if roll < 0.92:
+        return EventStatus.DRAFT
+    if roll < 0.96:
+        return EventStatus.CANCELLED
+    return EventStatus.REJECTED
+
+def pick_registration_status(rng: random.Random, event: Dict) -> RegistrationStatus:
+    status = event["status"]
+    if status == EventStatus.CANCELLED or rng.random() < 0.08:
+        return RegistrationStatus.CANCELLED
+    if status == EventStatus.COMPLETED:
+        return RegistrationStatus.ATTENDED if rng.random() < 0.7 else RegistrationStatus.REGISTERED
+    if status == EventStatus.ONGOING and rng.random() < 0.5:
+        return RegistrationStatus.ATTENDED
+    return RegistrationStatus.CONFIRMED if rng.random() < 0.3 else RegistrationStatus.REGISTERED
+
+class Generator:
+    def __init__(self, args):
+        self.args = args
+        self.anchor = datetime.fromisoformat(args.anchor)
+        self.prefix = f"synthetic-{args.seed}"
+        self.organizers = max(1, args.users // 50)
+        self.user_ids = [f"{self.prefix}-user-{index}" for index in range(args.users)]
+
+    def pick_users(self, rng: random.Random, count: int) -> List[int]:
+        """Distinct users, skewed towards a core of very active alumni"""
+        count = min(count, self.args.users)
+        if count > self.args.users // 2:
+            return sorted(rng.sample(range(self.args.users), count))
+        chosen = set()
+        while len(chosen) < count:
+            chosen.add(int(self.args.users * rng.random() ** 2))
+        return sorted(chosen)
+
+    def event(self, rng: random.Random, number: int) -> Dict:
+        args = self.args
+        event_type = rng.choices(list(TYPE_WEIGHTS), weights=list(TYPE_WEIGHTS.values()))[0]
+        # Three years of history, one year ahead, denser around the anchor
+        offset_days = rng.triangular(-3 * 365, 365, 0)
+        start = (self.anchor + timedelta(days=offset_days)).replace(
+            hour=rng.choice((9, 10, 13, 14, 16, 19)), minute=rng.choice((0, 30)), second=0, microsecond=0
+        )
+        end = start + timedelta(hours=rng.choice((1, 2, 3, 4, 8, 24, 48)))
+        tags = list(dict.fromkeys(rng.choices(TAGS, weights=TAG_WEIGHTS, k=rng.randint(1, 5))))
+        capacity = None if rng.random() < 0.2 else rng.choice(CAPACITIES)
+        status = pick_status(rng, start, end, self.anchor)
+        is_online = event_type == EventType.WEBINAR or rng.random() < 0.15
+        created = start - timedelta(days=rng.uniform(7, 90))
+
+        # Pareto-distributed demand: most events draw a handful, a few draw crowds
+        demand = rng.paretovariate(1.3) * args.avg_registrations * 0.25 * TYPE_SCALE[event_type]
+        if status in (EventStatus.DRAFT, EventStatus.PENDING_APPROVAL, EventStatus.REJECTED):
+            demand = 0
+        registrations = int(min(demand, capacity or args.users, args.users))
+
+        return {
+            "id": random_id(rng),
+            "organizerId": self.user_ids[rng.randrange(self.organizers)],
+            "title": f"{TITLE_WORDS[event_type]}: {tags[0].title()} #{number}",
+            "description": f"Synthetic {event_type.value.lower()} about {', '.join(tags)}",
+            "type": event_type,
+            "status": status,
+            "coverImage": None,
+            "startDate": start,
+            "endDate": end,
+            "location": "Online" if is_online else rng.choice(LOCATIONS),
+            "isOnline": is_online,
+            "meetingUrl": f"https://meet.example.com/{number}" if is_online else None,
+            "capacity": capacity,
+            "currentAttendees": 0,
+            "attendedCount": 0,
+            "price": 0 if rng.random() < 0.7 else rng.choice((25000, 50000, 100000, 250000)),
+            "currency": "IDR",
+            "tags": tags,
+            "requirements": None,
+            "agenda": None,
+            "speakers": None,
+            "viewCount": int(registrations * rng.uniform(3, 12)),
+            "createdAt": created,
+            "updatedAt": created,
+            "_registrations": registrations,
+        }
+
+    def registrations(self, rng: random.Random, event: Dict) -> List[Dict]:
+        rows = []
+        window = max((event["startDate"] - event["createdAt"]).total_seconds(), 1)
+        for user in self.pick_users(rng, event.pop("_registrations")):
+            status = pick_registration_status(rng, event)
+            registered = event["createdAt"] + timedelta(seconds=rng.uniform(0, window))
+            attended = None
+            if status == RegistrationStatus.ATTENDED:
+                attended = event["startDate"] + timedelta(minutes=rng.uniform(-30, 45))
+                event["attendedCount"] += 1
+            if status != RegistrationStatus.CANCELLED:
+                event["currentAttendees"] += 1
+            rows.append({
+                "id": random_id(rng),
+                "eventId": event["id"],
+                "userId": self.user_ids[user],
+                "status": status,
+                "notes": None,
+                "attendedAt": attended,
+                "registeredAt": registered,
+                "updatedAt": attended or registered,
+            })
+        return rows
+
+    def chunks(self) -> Iterator[Tuple[List[Dict], List[Dict]]]:
+        """(events, registrations) per chunk"""
+        args = self.args
+        for first in range(0, args.events, args.chunk_size):
+            events, registrations = [], []
+            for number in range(first, min(first + args.chunk_size, args.events)):
+                # One generator per event keeps the data independent of --chunk-size
+                rng = random.Random(f"{args.seed}:{number}")
+                event = self.event(rng, number)
+                registrations.extend(self.registrations(rng, event))
+                events.append(event)
+            yield events, registrations
+
+def json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value.value
+
+def write_ndjson(generator: Generator, output: str) -> Tuple[int, int]:
+    os.makedirs(output, exist_ok=True)
+    events_written = registrations_written = 0
+    with open(os.path.join(output, "events.ndjson"), "w") as events_file, \
+            open(os.path.join(output, "registrations.ndjson"), "w") as registrations_file:
+        for events, registrations in generator.chunks():
+            for event in events:
+                row = {name: event[name] for name in EVENT_COLUMNS}
+                events_file.write(json.dumps(row, default=json_default) + "\n")
+            for registration in registrations:
+                registrations_file.write(json.dumps(registration, default=json_default) + "\n")
+            events_written += len(events)
+            registrations_written += len(registrations)
+            print(f"   {events_written} events, {registrations_written} registrations")
+    return events_written, registrations_written
+
+def clean(conn, prefix: str) -> None:
+    """Remove data from an earlier run with the same seed (registrations cascade)"""
+    pattern = f"{prefix}-%"
+    deleted = conn.execute(
+        text('DELETE FROM identity_schema."Event" WHERE "organizerId" LIKE :pattern'),
+        {"pattern": pattern}
+    ).rowcount
+    if has_users_table(conn):
+        conn.execute(text("DELETE FROM identity_schema.users WHERE id LIKE :pattern"), {"pattern": pattern})
+    conn.commit()
+    print(f"🧹 Removed {deleted} events from an earlier run")
+
+def load(generator: Generator, args) -> Tuple[LoadStats, LoadStats]:
+    with engine.connect() as conn:
+        # Synthetic data can be regenerated, so don't wait for WAL flushes
+        conn.execute(text("SET synchronous_commit = off"))
+        if args.clean:
+            clean(conn, generator.prefix)
+
+        for first in range(0, args.users, args.chunk_size):
+            ensure_users(conn, generator.user_ids[first:first + args.chunk_size])
+        conn.commit()
+
+        # Counters are exact from generation, so they are loaded as-is
+        events = event_loader(conn, "skip", args.method, columns=EVENT_COLUMNS + COUNTER_COLUMNS)
+        registrations = registration_loader(conn, "skip", args.method)
+        for event_rows, registration_rows in generator.chunks():
+            events.load(event_rows)
+            registrations.load(registration_rows)
+            conn.commit()
+            print(
+                f"   {events.stats.rows} events ({events.stats.throughput:,.0f}/s), "
+                f"{registrations.stats.rows} registrations ({registrations.stats.throughput:,.0f}/s)"
+            )
+        analyze(conn)
+        conn.commit()
+    return events.stats, registrations.stats
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic events and registrations")
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--avg-registrations", type=float, default=20, help="typical registrations per event")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--anchor", default=datetime.utcnow().date().isoformat(),
+                        help="date treated as 'now' when placing events (default: today)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="events generated and loaded per chunk")
+    parser.add_argument("--method", choices=LOAD_METHODS, default="copy")
+    parser.add_argument("--clean", action="store_true", help="delete data from an earlier run with this seed first")
+    parser.add_argument("--output", help="write NDJSON files to this directory instead of loading")
+    args = parser.parse_args()
+
+    generator = Generator(args)
+    start = time.perf_counter()
+    if args.output:
+        events, registrations = write_ndjson(generator, args.output)
+        print(f"✅ Wrote {events} events and {registrations} registrations to {args.output} "
+              f"in {time.perf_counter() - start:.2f}s")
+        return
+
+    events, registrations = load(generator, args)
+    print(f"📊 {events.summary('events')}")
+    print(f"📊 {registrations.summary('registrations')}")
+    print(f"✅ Generated in {time.perf_counter() - start:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Bulk import of historical events and registrations from CSV or NDJSON
+Rows are validated with the pydantic schemas in app/schemas/event.py and
+loaded in batches through Postgres COPY (see scripts/bulk_load.py). Events
+are loaded before registrations, and seat/attendance counters are
+recomputed for every event that received registrations.
+
+CSV columns are the schema field names. In CSV, tags are separated by "|"
+(or given as a JSON array) and empty cells count as missing. Events without
+an id get a stable one derived from organizer, title and start date, so
+re-running an import does not duplicate them. Rows whose organizer, event
+or user does not exist are reported with their line like invalid rows.
+
+Usage:
+    python -m scripts.import_events --events events.csv --registrations registrations.csv
+    python -m scripts.import_events --events events.ndjson --on-conflict update --batch-size 10000
+    python -m scripts.import_events --registrations registrations.ndjson --dry-run
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+from pydantic import BaseModel, ValidationError
+from app.database.connection import engine
+from app.schemas.event import ImportEventInput, ImportRegistrationInput
+from scripts.bulk_load import (
+    CONFLICT_MODES, LOAD_METHODS, StagedTable, analyze, event_loader,
+    recount_staged_events, registration_loader
+)
+
+# Stable ids for events that arrive without one
+EVENT_ID_NAMESPACE = uuid.UUID("6f1c2a4e-8d3b-4f0a-9c5e-2b7d1e9a4c30")
+MAX_REPORTED_ERRORS = 20
+
+def detect_format(path: str, format: Optional[str]) -> str:
+    if format:
+        return format
+    return "ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv"
+
+def csv_row(row: Dict[str, str]) -> Dict:
+    """Drop empty cells so schema defaults apply and split list cells"""
+    data = {key: value for key, value in row.items() if key and value not in (None, "")}
+    tags = data.get("tags")
+    if tags is not None:
+        data["tags"] = json.loads(tags) if tags.startswith("[") else [
+            tag.strip() for tag in tags.split("|") if tag.strip()
+        ]
+    return data
+
+def read_rows(path: str, format: str) -> Iterator[Tuple[int, Union[Dict, str]]]:
+    """(line number, unparsed row) pairs, read lazily"""
+    with open(path, newline="", encoding="utf-8") as f:
+        if format == "csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+        else:
+            for line_no, line in enumerate(f, 1):
+                if line.strip():
+                    yield line_no, line
+
+def parse_row(row: Union[Dict, str]) -> Dict:
+    return csv_row(row) if isinstance(row, dict) else json.loads(row)
+
+def event_row(event: ImportEventInput, now: datetime) -> Dict:
+    row = event.model_dump()
+    if not row["id"]:
+        key = f"{event.organizerId}|{event.title}|{event.startDate.isoformat()}"
+        row["id"] = str(uuid.uuid5(EVENT_ID_NAMESPACE, key))
+    row["tags"] = row["tags"] or []
+    row["createdAt"] = row["createdAt"] or now
+    row["updatedAt"] = now
+    return row
+
+def registration_row(registration: ImportRegistrationInput, now: datetime) -> Dict:
+    row = registration.model_dump()
+    row["id"] = row["id"] or str(uuid.uuid4())
+    row["registeredAt"] = row["registeredAt"] or now
+    row["updatedAt"] = now
+    return row
+
+def describe_error(error: ValueError) -> str:
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}"
+            for detail in error.errors()
+        )
+    return str(error)
+
+class Importer:
+    def __init__(self, args):
+        self.args = args
+        self.now = datetime.utcnow()
+        self.invalid = 0
+
+    def batches(
+        self,
+        path: str,
+        schema: type,
+        to_row: Callable[[BaseModel, datetime], Dict]
+    ) -> Iterator[List[Tuple[int, Dict]]]:
+        """Validated (line number, row) pairs from a file, grouped into load batches"""
+        batch = []
+        for line_no, raw in read_rows(path, detect_format(path, self.args.format)):
+            try:
+                batch.append((line_no, to_row(schema.model_validate(parse_row(raw)), self.now)))
+            except ValueError as e:
+                # ValidationError, or malformed JSON in an NDJSON line or tags cell
+                self.report(path, line_no, describe_error(e))
+                continue
+            if len(batch) >= self.args.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def report(self, path: str, line_no: int, message: str) -> None:
+        self.invalid += 1
+        if self.args.strict:
+            raise SystemExit(f"❌ {path}:{line_no}: {message}")
+        if self.invalid <= MAX_REPORTED_ERRORS:
+            print(f"   ⚠️ {path}:{line_no}: {message}", file=sys.stderr)
+
+    def report_rejected(self, path: str, loader: StagedTable, batch: List[Tuple[int, Dict]]) -> None:
+        """Point at the lines whose organizer, event or user does not exist"""
+        lines: Dict[Tuple[str, ...], List[Tuple[int, Dict]]] = {}
+        for line_no, row in batch:
+            lines.setdefault(tuple(str(row[name]) for name in loader.unique), []).append((line_no, row))
+        rejected = sorted(
+            ((lines[key].pop(0), column) for key, column in loader.rejected),
+            key=lambda item: item[0][0]
+        )
+        for (line_no, row), column in rejected:
+            self.report(path, line_no, f"{column}: {row[column]} does not exist")
+
+    def load(self, conn, loader: StagedTable, path: str, schema: type, to_row, after_batch=None) -> None:
+        for batch in self.batches(path, schema, to_row):
+            loader.load([row for _, row in batch])
+            self.report_rejected(path, loader, batch)
+            if after_batch:
+                after_batch(conn, loader)
+            conn.commit()
+            print(f"   {loader.staging}: {loader.stats.rows} rows ({loader.stats.throughput:,.0f} rows/s)")
+
+def run(args) -> None:
+    importer = Importer(args)
+    start = time.perf_counter()
+    results = []
+
+    if args.dry_run:
+        # Validation only: count the rows that would be loaded
+        for path, schema, to_row, label in (
+            (args.events, ImportEventInput, event_row, "events"),
+            (args.registrations, ImportRegistrationInput, registration_row, "registrations"),
+        ):
+            if path:
+                rows = sum(len(batch) for batch in importer.batches(path, schema, to_row))
+                results.append(f"{label}: {rows} valid rows")
+    else:
+        with engine.connect() as conn:
+            if args.events:
+                events = event_loader(conn, args.on_conflict, args.method)
+                importer.load(conn, events, args.events, ImportEventInput, event_row)
+                results.append(events.stats.summary("events"))
+            if args.registrations:
+                registrations = registration_loader(conn, args.on_conflict, args.method)
+                importer.load(
+                    conn, registrations, args.registrations, ImportRegistrationInput,
+                    registration_row, after_batch=recount_staged_events
+                )
+                results.append(registrations.stats.summary("registrations"))
+            analyze(conn)
+            conn.commit()
+
+    elapsed = time.perf_counter() - start
+    for line in results:
+        print(f"📊 {line}")
+    if importer.invalid:
+        print(f"⚠️ {importer.invalid} invalid rows were not imported")
+    print(f"{'✅ Validated' if args.dry_run else '✅ Imported'} in {elapsed:.2f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import events and registrations")
+    parser.add_argument("--events", help="CSV or NDJSON file of events")
+    parser.add_argument("--registrations", help="CSV or NDJSON file of registrations")
+    parser.add_argument("--format", choices=("csv", "ndjson"), help="input format (default: by file extension)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="rows per COPY batch and commit")
+    parser.add_argument("--on-conflict", choices=CONFLICT_MODES, default="skip",
+                        help="skip existing rows or update them (events by id, registrations by event and user)")
+    parser.add_argument("--method", choices=LOAD_METHODS, default="copy",
+                        help="fill the staging table with COPY or multi-row INSERTs")
+    parser.add_argument("--strict", action="store_true", help="stop at the first invalid row")
+    parser.add_argument("--dry-run", action="store_true", help="validate the files without loading them")
+    args = parser.parse_args()
+
+    if not args.events and not args.registrations:
+        parser.error("nothing to import, pass --events and/or --registrations")
+    run(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Concurrent load harness for registerEvent
+Floods one event with simultaneous registrations (including duplicate
+requests from the same user) and checks that it is never overbooked.
+
+Usage:
+    python -m scripts.load_register --capacity 100 --users 1000 --concurrency 200
+    python -m scripts.load_register --url http://localhost:4002
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from sqlalchemy import func, select
+from app.database.connection import SessionLocal
+from app.models.event import (
+    Event, EventStatus, EventType, Registration, RegistrationStatus
+)
+from scripts.common import delete_users, ensure_users, graphql, graphql_client, make_token
+
+REGISTER_MUTATION = """
+mutation Register($eventId: ID!) {
+  registerEvent(eventId: $eventId) { id status }
+}
+"""
+
+def create_event(capacity: int, organizer_id: str) -> str:
+    db = SessionLocal()
+    try:
+        ensure_users(db, [organizer_id])
+        event = Event(
+            organizerId=organizer_id,
+            title=f"Load test {datetime.utcnow().isoformat()}",
+            description="Synthetic event for the registerEvent load harness",
+            type=EventType.REUNION,
+            status=EventStatus.PUBLISHED,
+            startDate=datetime.utcnow() + timedelta(days=30),
+            endDate=datetime.utcnow() + timedelta(days=30, hours=4),
+            location="Load test",
+            capacity=capacity,
+            currentAttendees=0,
+        )
+        db.add(event)
+        db.commit()
+        return event.id
+    finally:
+        db.close()
+
+def verify(event_id: str) -> dict:
+    db = SessionLocal()
+    try:
+        event = db.get(Event, event_id)
+        active = db.scalar(
+            select(func.count(Registration.id)).where(
+                Registration.eventId == event_id,
+                Registration.status != RegistrationStatus.CANCELLED
+            )
+        )
+        duplicates = db.scalar(
+            select(func.count()).select_from(
+                select(Registration.userId)
+                .where(Registration.eventId == event_id)
+                .group_by(Registration.userId)
+                .having(func.count() > 1)
+                .subquery()
+            )
+        )
+        return {
+            "capacity": event.capacity,
+            "currentAttendees": event.currentAttendees,
+            "activeRegistrations": active,
+            "duplicateUsers": duplicates,
+        }
+    finally:
+        db.close()
+
+def cleanup(event_id: str, user_ids: list) -> None:
+    db = SessionLocal()
+    try:
+        event = db.get(Event, event_id)
+        if event:
+            db.delete(event)
+        delete_users(db, user_ids)
+        db.commit()
+    finally:
+        db.close()
+
+async def run_load(args, event_id: str, user_ids: list) -> tuple:
+    # Every user registers once, a share of them fires a second concurrent request
+    tokens = {user_id: make_token(user_id) for user_id in user_ids}
+    requests = list(user_ids) + user_ids[:int(len(user_ids) * args.duplicates)]
+    semaphore = asyncio.Semaphore(args.concurrency)
+    outcomes = Counter()
+
+    async with graphql_client(args.url) as client:
+        async def register(user_id: str):
+            async with semaphore:
+                body = await graphql(client, REGISTER_MUTATION, {"eventId": event_id}, tokens[user_id])
+            if body.get("errors"):
+                outcomes[body["errors"][0]["message"]] += 1
+            else:
+                outcomes["registered"] += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(register(user_id) for user_id in requests))
+        elapsed = time.perf_counter() - start
+
+    return outcomes, elapsed, len(requests)
+
+def main():
+    parser = argparse.ArgumentParser(description="registerEvent overbooking load harness")
+    parser.add_argument("--capacity", type=int, default=100)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duplicates", type=float, default=0.2, help="share of users sending a second request")
+    parser.add_argument("--url", help="base URL of a running service (default: in-process app)")
+    parser.add_argument("--keep", action="store_true", help="keep the synthetic event and users")
+    args = parser.parse_args()
+
+    run_id = uuid.uuid4().hex[:8]
+    organizer_id = f"loadtest-{run_id}-organizer"
+    user_ids = [f"loadtest-{run_id}-{i}" for i in range(args.users)]
+
+    db = SessionLocal()
+    try:
+        ensure_users(db, user_ids)
+        db.commit()
+    finally:
+        db.close()
+
+    event_id = create_event(args.capacity, organizer_id)
+    print(f"🎟️ Event {event_id}: capacity {args.capacity}, {args.users} users, concurrency {args.concurrency}")
+
+    try:
+        outcomes, elapsed, total = asyncio.run(run_load(args, event_id, user_ids))
+        state = verify(event_id)
+
+        print(f"⏱️ {total} requests in {elapsed:.2f}s ({total / elapsed:.1f} req/s)")
+        print(f"✅ {outcomes['registered']} registrations ({outcomes['registered'] / elapsed:.1f} registrations/s)")
+        for message, count in outcomes.most_common():
+            if message != "registered":
+                print(f"   {count} × {message}")
+        print(f"📊 {state}")
+
+        expected = min(args.capacity, args.users)
+        ok = (
+            state["activeRegistrations"] <= args.capacity
+            and state["activeRegistrations"] == state["currentAttendees"]
+            and state["activeRegistrations"] == outcomes["registered"] == expected
+            and state["duplicateUsers"] == 0
+        )
+        print("🎉 No overbooking detected" if ok else "❌ Overbooking or counter drift detected")
+        if not ok:
+            raise SystemExit(1)
+    finally:
+        if not args.keep:
+            cleanup(event_id, user_ids + [organizer_id])
+
+if __name__ == "__main__":
+    main()
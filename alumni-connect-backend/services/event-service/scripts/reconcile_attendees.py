@@ -0,0 +1,39 @@
+"""
+Recompute Event.currentAttendees from registrations
+currentAttendees is the single source of truth for seat counts; this pass
+repairs any drift in bulk with grouped SQL.
+
+Usage:
+    python -m scripts.reconcile_attendees [--dry-run] [--event EVENT_ID ...]
+"""
+import argparse
+import asyncio
+from app.database.connection import AsyncSessionLocal, async_engine
+from app.services.reconciliation import reconcile_attendee_counts
+
+async def run(args) -> list:
+    try:
+        async with AsyncSessionLocal() as db:
+            return await reconcile_attendee_counts(db, args.event, dry_run=args.dry_run)
+    finally:
+        await async_engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconcile Event.currentAttendees")
+    parser.add_argument("--dry-run", action="store_true", help="report drift without fixing it")
+    parser.add_argument("--event", action="append", help="limit to these event ids")
+    args = parser.parse_args()
+
+    drift = asyncio.run(run(args))
+    for row in drift:
+        print(f"   {row['eventId']}: counter {row['counter']} → {row['actual']}")
+
+    if not drift:
+        print("✅ No drift found")
+    elif args.dry_run:
+        print(f"⚠️ {len(drift)} events drifted (dry run, nothing changed)")
+    else:
+        print(f"✅ Reconciled {len(drift)} events")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""Shared helpers for the event-service tests"""
+import asyncio
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from app.database.connection import DATABASE_URL
+
+def postgres_available() -> bool:
+    """DATABASE_URL is set and the server accepts connections"""
+    if not DATABASE_URL or not DATABASE_URL.startswith(("postgresql", "postgres")):
+        return False
+    probe = create_engine(DATABASE_URL, connect_args={"connect_timeout": 3})
+    try:
+        with probe.connect():
+            return True
+    except OperationalError:
+        return False
+    finally:
+        probe.dispose()
+
+requires_postgres = pytest.mark.skipif(
+    not postgres_available(),
+    reason="needs a reachable Postgres at DATABASE_URL"
+)
+
+def run(coroutine):
+    """Run a coroutine to completion from a sync test"""
+    return asyncio.run(coroutine)
@@ -0,0 +1,25 @@
+from app.auth import checkin
+from app.auth.checkin import sign_checkin_token, verify_checkin_token
+from app.auth.jwt import JWT_SECRET
+
+def test_token_round_trip():
+    token = sign_checkin_token("registration-1", "event-1")
+    assert verify_checkin_token(token) == ("registration-1", "event-1")
+
+def test_tampered_tokens_are_rejected():
+    token = sign_checkin_token("registration-1", "event-1")
+    registration_id, event_id, signature = token.split(".")
+    assert verify_checkin_token(f"registration-2.{event_id}.{signature}") is None
+    assert verify_checkin_token(f"{registration_id}.event-2.{signature}") is None
+    flipped = signature[:-1] + ("B" if signature.endswith("A") else "A")
+    assert verify_checkin_token(f"{registration_id}.{event_id}.{flipped}") is None
+
+def test_malformed_tokens_are_rejected():
+    for token in ("", "a.b", "a..c", "a.b.c.d"):
+        assert verify_checkin_token(token) is None
+
+def test_signing_key_is_not_the_jwt_secret(monkeypatch):
+    monkeypatch.delenv("CHECKIN_TOKEN_SECRET", raising=False)
+    assert checkin._checkin_key() != JWT_SECRET.encode()
+    monkeypatch.setenv("CHECKIN_TOKEN_SECRET", "door-secret")
+    assert checkin._checkin_key() == b"door-secret"
@@ -0,0 +1,29 @@
+import time
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.database import connection
+from app.database.connection import ASYNC_DATABASE_URL, TimedAsyncAdaptedQueuePool
+from tests.support import requires_postgres, run
+
+@requires_postgres
+def test_connect_time_is_not_counted_as_pool_wait(monkeypatch):
+    waits = []
+    monkeypatch.setattr(connection.pool_wait_stats, "record", waits.append)
+    engine = create_async_engine(
+        ASYNC_DATABASE_URL, poolclass=TimedAsyncAdaptedQueuePool, pool_size=1, max_overflow=0
+    )
+
+    @event.listens_for(engine.sync_engine, "do_connect")
+    def slow_connect(dialect, conn_rec, cargs, cparams):
+        time.sleep(0.2)
+
+    async def checkout():
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        finally:
+            await engine.dispose()
+
+    run(checkout())
+    # The pool had room, so opening the connection is the only delay
+    assert len(waits) == 1 and waits[0] < 0.1
@@ -0,0 +1,20 @@
+from app.graphql.resolvers import schema
+from app.observability.metrics import graphql_requests
+from tests.support import run
+
+def test_syntax_error_is_reported_and_counted():
+    before = graphql_requests.value(operation="invalid", type="unknown")
+
+    result = run(schema.execute("{ events( }"))
+
+    assert result.data is None
+    assert [error.message for error in result.errors][0].startswith("Syntax Error")
+    assert graphql_requests.value(operation="invalid", type="unknown") == before + 1
+
+def test_unknown_operation_name_is_counted():
+    before = graphql_requests.value(operation="unknown", type="unknown")
+
+    result = run(schema.execute("query A { __typename }", operation_name="B"))
+
+    assert result.errors
+    assert graphql_requests.value(operation="unknown", type="unknown") == before + 1
@@ -0,0 +1,36 @@
+from argparse import Namespace
+from tests.support import requires_postgres
+
+EVENTS_CSV = """id,organizerId,title,description,type,startDate,endDate,location
+import-check-1,import-check-nobody,Unknown organizer,Desc,WEBINAR,2027-01-01T10:00:00,2027-01-01T12:00:00,Online
+"""
+
+REGISTRATIONS_CSV = """eventId,userId,status
+import-check-missing,import-check-nobody,REGISTERED
+"""
+
+@requires_postgres
+def test_rows_with_missing_references_are_reported_by_line(tmp_path, capsys):
+    from app.database.connection import engine
+    from app.schemas.event import ImportEventInput, ImportRegistrationInput
+    from scripts.bulk_load import event_loader, registration_loader
+    from scripts.import_events import Importer, event_row, registration_row
+
+    events_path = tmp_path / "events.csv"
+    events_path.write_text(EVENTS_CSV)
+    registrations_path = tmp_path / "registrations.csv"
+    registrations_path.write_text(REGISTRATIONS_CSV)
+    importer = Importer(Namespace(format=None, batch_size=100, strict=False))
+
+    with engine.connect() as conn:
+        events = event_loader(conn)
+        importer.load(conn, events, str(events_path), ImportEventInput, event_row)
+        registrations = registration_loader(conn)
+        importer.load(conn, registrations, str(registrations_path), ImportRegistrationInput, registration_row)
+
+    assert (events.stats.rejected, events.stats.inserted) == (1, 0)
+    assert (registrations.stats.rejected, registrations.stats.inserted) == (1, 0)
+    assert importer.invalid == 2
+    errors = capsys.readouterr().err
+    assert f"{events_path}:2: organizerId: import-check-nobody does not exist" in errors
+    assert f"{registrations_path}:2: eventId: import-check-missing does not exist" in errors
@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+import pytest
+from graphql import OperationDefinitionNode, parse
+from app.graphql.limits import MAX_PAGE_SIZE, check_filter, operation_cost
+
+def cost_of(query: str, variables: dict = None):
+    document = parse(query)
+    operation = next(d for d in document.definitions if isinstance(d, OperationDefinitionNode))
+    return operation_cost(document, operation, variables)
+
+def make_filter(**overrides):
+    values = {"limit": 20, "offset": 0, "orderBy": "startDate", "order": "asc"}
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+def test_valid_filter_passes():
+    check_filter(make_filter())
+
+@pytest.mark.parametrize("overrides, message", [
+    ({"limit": 0}, "limit must be between"),
+    ({"limit": MAX_PAGE_SIZE + 1}, "limit must be between"),
+    ({"offset": -1}, "offset cannot be negative"),
+    ({"orderBy": "title"}, "Cannot order by 'title'"),
+    ({"order": "sideways"}, "order must be"),
+])
+def test_invalid_filter_is_rejected(overrides, message):
+    with pytest.raises(Exception, match=message):
+        check_filter(make_filter(**overrides))
+
+def test_page_fields_multiply_by_requested_rows():
+    cost, depth = cost_of("{ events(filter: { limit: 10 }) { events { id title } } }")
+    # events (1) + 10 rows x (events (1) + id (1) + title (1))
+    assert (cost, depth) == (1 + 10 * 3, 3)
+
+def test_page_size_comes_from_variables_and_is_capped():
+    query = "query($f: EventFilterInput) { events(filter: $f) { events { id } } }"
+    assert cost_of(query, {"f": {"limit": 5}})[0] == 1 + 5 * 2
+    assert cost_of(query, {"f": {"limit": 10_000}})[0] == 1 + MAX_PAGE_SIZE * 2
+
+def test_fragments_count_towards_cost_and_introspection_is_free():
+    query = """
+    query { event(id: "1") { ...Fields __typename } }
+    fragment Fields on Event { id title }
+    """
+    assert cost_of(query) == (3, 2)
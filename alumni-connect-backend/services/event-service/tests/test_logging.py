@@ -0,0 +1,7 @@
+import logging
+from app.observability.logging import QUIET_LOGGERS, setup_logging
+
+def test_http_client_loggers_stay_quiet():
+    setup_logging()
+    for name in QUIET_LOGGERS:
+        assert not logging.getLogger(name).isEnabledFor(logging.INFO)
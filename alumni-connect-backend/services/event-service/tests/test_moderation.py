@@ -0,0 +1,99 @@
+import uuid
+from datetime import datetime, timedelta
+import pytest
+from app.services.moderation import MAX_BULK_MODERATION, approve_events, reject_events
+from tests.support import requires_postgres, run
+
+def test_reject_nothing_issues_no_sql():
+    # db=None: any statement would fail
+    assert run(reject_events(None, {}, "admin")) == []
+
+def test_bulk_moderation_is_capped():
+    event_ids = [f"event-{i}" for i in range(MAX_BULK_MODERATION + 1)]
+    with pytest.raises(Exception, match="At most"):
+        run(approve_events(None, event_ids, "admin"))
+    with pytest.raises(Exception, match="At most"):
+        run(reject_events(None, dict.fromkeys(event_ids, "Duplicate"), "admin"))
+
+APPROVE_EVENT = """
+mutation Approve($id: ID!) { approveEvent(eventId: $id) { id status } }
+"""
+
+async def execute(query: str, variables: dict, token: str) -> dict:
+    from app.database.connection import async_engine
+    from scripts.common import graphql, graphql_client
+
+    try:
+        async with graphql_client() as client:
+            return await graphql(client, query, variables, token)
+    finally:
+        # Pooled asyncpg connections belong to this event loop
+        await async_engine.dispose()
+
+def test_approve_event_requires_super_admin():
+    from scripts.common import make_token
+
+    body = run(execute(APPROVE_EVENT, {"id": "any-event"}, make_token("moderation-alumni")))
+    assert body["data"] is None
+    assert body["errors"][0]["message"] == "Unauthorized: Super Admin access required"
+
+@pytest.fixture
+def pending_event():
+    from sqlalchemy import delete
+    from app.database.connection import SessionLocal
+    from app.models.event import Event, EventStatus, EventType
+    from scripts.common import delete_users, ensure_users
+
+    organizer_id = f"moderation-{uuid.uuid4().hex[:8]}"
+    start = datetime.utcnow() + timedelta(days=30)
+    db = SessionLocal()
+    try:
+        ensure_users(db, [organizer_id])
+        event = Event(
+            organizerId=organizer_id,
+            title="Pending moderation check",
+            description="Synthetic event for the approval test",
+            type=EventType.WEBINAR,
+            status=EventStatus.PENDING_APPROVAL,
+            startDate=start,
+            endDate=start + timedelta(hours=2),
+            location="Online",
+            isOnline=True,
+        )
+        db.add(event)
+        db.commit()
+        event_id = event.id
+    finally:
+        db.close()
+
+    yield event_id
+
+    db = SessionLocal()
+    try:
+        db.execute(delete(Event).where(Event.id == event_id))
+        delete_users(db, [organizer_id])
+        db.commit()
+    finally:
+        db.close()
+
+@requires_postgres
+def test_approve_event_records_the_reviewer(pending_event):
+    from app.database.connection import SessionLocal
+    from app.models.event import Event
+    from scripts.common import make_token
+
+    token = make_token("moderation-admin", role="SUPER_ADMIN")
+    body = run(execute(APPROVE_EVENT, {"id": pending_event}, token))
+    assert body["data"]["approveEvent"] == {"id": pending_event, "status": "PUBLISHED"}
+
+    db = SessionLocal()
+    try:
+        event = db.get(Event, pending_event)
+        assert event.approvedBy == "moderation-admin"
+        assert event.approvedAt is not None
+    finally:
+        db.close()
+
+    # Only pending events can be approved
+    body = run(execute(APPROVE_EVENT, {"id": pending_event}, token))
+    assert body["errors"][0]["message"] == "Event is PUBLISHED, not pending approval"
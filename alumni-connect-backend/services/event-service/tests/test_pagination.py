@@ -0,0 +1,98 @@
+import base64
+import json
+from datetime import datetime
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import asyncpg
+from app.graphql.pagination import decode_cursor, encode_cursor, estimated_count
+from app.graphql.resolvers import apply_event_filters
+from app.graphql.types import EventFilterInput
+from app.models.event import Event as EventModel
+from tests.support import requires_postgres, run
+
+def test_cursor_round_trip_restores_datetimes():
+    start = datetime(2026, 10, 18, 9, 30)
+    cursor = encode_cursor("startDate", start, "event-1")
+    assert decode_cursor(cursor, "startDate") == (start, "event-1")
+
+def test_cursor_without_value_is_not_issued():
+    assert encode_cursor("startDate", None, "event-1") is None
+
+@pytest.mark.parametrize("cursor", ["not base64!", "e30=", "bnVsbA=="])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(Exception, match="Invalid cursor"):
+        decode_cursor(cursor, "startDate")
+
+def test_cursor_for_another_sort_key_is_rejected():
+    cursor = encode_cursor("createdAt", datetime(2026, 1, 1), "event-1")
+    with pytest.raises(Exception, match="Invalid cursor"):
+        decode_cursor(cursor, "startDate")
+
+@pytest.mark.parametrize("value", ["next tuesday", 20261018])
+def test_cursor_with_unparseable_date_is_rejected(value):
+    payload = json.dumps({"k": "startDate", "v": value, "id": "event-1"})
+    cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+    with pytest.raises(Exception, match="Invalid cursor"):
+        decode_cursor(cursor, "startDate")
+
+class FakeBind:
+    """Async engine stand-in that compiles statements for Postgres and records them"""
+    dialect = asyncpg.dialect()
+
+    def __init__(self, plan):
+        self.plan = plan
+        self.statements = []
+
+    def connect(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        compiled = statement.compile(dialect=self.dialect)
+        self.statements.append((str(compiled), compiled.params))
+        return self
+
+    def scalar(self):
+        return self.plan
+
+class FakeSession:
+    def __init__(self, bind):
+        self.bind = bind
+
+def test_estimated_count_explains_search_queries_with_bound_parameters():
+    bind = FakeBind(json.dumps([{"Plan": {"Plan Rows": 42}}]))
+    query = apply_event_filters(select(EventModel), EventFilterInput(search="data science"))
+
+    assert run(estimated_count(FakeSession(bind), query)) == 42
+
+    [(sql, params)] = bind.statements
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "websearch_to_tsquery" in sql
+    assert "data science" in params.values()
+
+@requires_postgres
+def test_malformed_cursor_is_rejected_before_counting():
+    from app.database.connection import async_engine
+    from app.observability.sql import track_queries
+    from scripts.common import graphql, graphql_client
+
+    async def request():
+        try:
+            async with graphql_client() as client:
+                with track_queries() as stats:
+                    body = await graphql(
+                        client,
+                        '{ events(filter: { after: "not a cursor", totalCount: ESTIMATED }) { events { id } } }'
+                    )
+            return body, stats.count
+        finally:
+            await async_engine.dispose()
+
+    body, statements = run(request())
+    assert body["errors"][0]["message"] == "Invalid cursor"
+    assert statements == 0
@@ -0,0 +1,41 @@
+import hashlib
+import pytest
+from app.graphql.persisted_queries import PersistedQueryError, PersistedQueryStore
+
+QUERY = "{ events { events { id } } }"
+DIGEST = hashlib.sha256(QUERY.encode()).hexdigest()
+
+def apq(digest: str = DIGEST, version: int = 1) -> dict:
+    return {"persistedQuery": {"version": version, "sha256Hash": digest}}
+
+def test_plain_queries_pass_through():
+    assert PersistedQueryStore(maxsize=10, ttl=60).resolve(QUERY, None) == QUERY
+
+def test_hash_only_request_before_registration_is_not_found():
+    with pytest.raises(PersistedQueryError) as error:
+        PersistedQueryStore(maxsize=10, ttl=60).resolve(None, apq())
+    assert error.value.code == "PERSISTED_QUERY_NOT_FOUND"
+
+def test_registered_query_is_served_by_hash():
+    store = PersistedQueryStore(maxsize=10, ttl=60)
+    assert store.resolve(QUERY, apq()) == QUERY
+    assert store.resolve(None, apq()) == QUERY
+
+def test_mismatched_hash_is_rejected_and_not_stored():
+    store = PersistedQueryStore(maxsize=10, ttl=60)
+    with pytest.raises(PersistedQueryError) as error:
+        store.resolve(QUERY, apq(digest="0" * 64))
+    assert error.value.code == "BAD_REQUEST"
+    with pytest.raises(PersistedQueryError):
+        store.resolve(None, apq(digest="0" * 64))
+
+def test_unsupported_version_is_rejected():
+    with pytest.raises(PersistedQueryError) as error:
+        PersistedQueryStore(maxsize=10, ttl=60).resolve(QUERY, apq(version=2))
+    assert error.value.code == "PERSISTED_QUERY_NOT_SUPPORTED"
+
+@pytest.mark.parametrize("persisted", ["x", [DIGEST], 1])
+def test_non_object_extension_is_rejected(persisted):
+    with pytest.raises(PersistedQueryError) as error:
+        PersistedQueryStore(maxsize=10, ttl=60).resolve(QUERY, {"persistedQuery": persisted})
+    assert error.value.code == "BAD_REQUEST"
@@ -0,0 +1,161 @@
+"""
+N+1 regression tests for the GraphQL resolvers
+Seeds events and registrations in the Postgres at DATABASE_URL, runs
+`events`, `event` and `myRegistrations` at several result sizes and checks
+that each one issues the same fixed number of SQL statements.
+"""
+import uuid
+from datetime import datetime, timedelta
+import pytest
+from tests.support import requires_postgres, run
+
+pytestmark = requires_postgres
+
+EVENT_FIELDS = """
+  id title status registrationsCount hasRegistered registrationStatus
+  isFull percentage daysLeft viewCount
+"""
+
+EVENTS_QUERY = """
+query Events($limit: Int!) {
+  events(filter: { limit: $limit }) { events { %s } pagination { total hasMore endCursor } }
+}
+""" % EVENT_FIELDS
+
+PLAIN_EVENTS_QUERY = """
+query Events($limit: Int!) {
+  events(filter: { limit: $limit }) { events { id title startDate endDate } }
+}
+"""
+
+EVENT_QUERY = """
+query Event($id: ID!) { event(id: $id) { %s } }
+""" % EVENT_FIELDS
+
+MY_REGISTRATIONS_QUERY = """
+query MyRegistrations { myRegistrations { id status event { %s } } }
+""" % EVENT_FIELDS
+
+# Statements each operation may issue, independent of result size
+EXPECTED = {
+    "events (anonymous)": 2,     # count + page
+    "events (viewer)": 3,        # count + page + batched viewer registrations
+    "events (viewer, plain)": 2, # viewer fields not selected, so no registration lookup
+    "event (viewer)": 2,         # row + viewer registration
+    "myRegistrations": 1,        # registrations joined with their events
+}
+
+EVENT_COUNT = 50
+SIZES = (1, 10, 50)
+
+def seed(run_id: str) -> tuple:
+    """Create EVENT_COUNT events and one viewer per size registered to that many events"""
+    from app.database.connection import SessionLocal
+    from app.models.event import Event, EventStatus, EventType, Registration, RegistrationStatus
+    from scripts.common import ensure_users
+
+    organizer_id = f"querycheck-{run_id}-organizer"
+    viewers = {size: f"querycheck-{run_id}-viewer-{size}" for size in SIZES}
+    now = datetime.utcnow()
+
+    db = SessionLocal()
+    try:
+        ensure_users(db, [organizer_id, *viewers.values()])
+        events = [
+            Event(
+                organizerId=organizer_id,
+                title=f"Query check {run_id} #{i}",
+                description="Synthetic event for the statement count check",
+                type=EventType.WEBINAR,
+                status=EventStatus.PUBLISHED,
+                startDate=now + timedelta(days=10 + i),
+                endDate=now + timedelta(days=10 + i, hours=2),
+                location="Online",
+                isOnline=True,
+                capacity=EVENT_COUNT * 2,
+                currentAttendees=0,
+            )
+            for i in range(EVENT_COUNT)
+        ]
+        db.add_all(events)
+        db.flush()
+
+        for size, viewer_id in viewers.items():
+            for event in events[:size]:
+                db.add(Registration(
+                    eventId=event.id,
+                    userId=viewer_id,
+                    status=RegistrationStatus.REGISTERED
+                ))
+                event.currentAttendees += 1
+        db.commit()
+        return [event.id for event in events], organizer_id, viewers
+    finally:
+        db.close()
+
+def cleanup(event_ids: list, user_ids: list) -> None:
+    from sqlalchemy import delete
+    from app.database.connection import SessionLocal
+    from app.models.event import Event, Registration
+    from scripts.common import delete_users
+
+    db = SessionLocal()
+    try:
+        # Core deletes, in FK order: delete_users cascades to whatever is left,
+        # which would leave queued ORM deletes matching no rows at flush
+        db.execute(delete(Registration).where(Registration.eventId.in_(event_ids)))
+        db.execute(delete(Event).where(Event.id.in_(event_ids)))
+        delete_users(db, user_ids)
+        db.commit()
+    finally:
+        db.close()
+
+async def measure_all(event_ids: list, viewers: dict) -> dict:
+    """Statement counts per operation, keyed by result size"""
+    from app.cache.event_listing import event_listing_cache
+    from app.database.connection import async_engine
+    from app.observability.sql import instrument_engine, track_queries
+    from scripts.common import graphql, graphql_client, make_token
+
+    instrument_engine(async_engine)
+    counts = {name: {} for name in EXPECTED}
+    try:
+        async with graphql_client() as client:
+            for size, viewer_id in viewers.items():
+                token = make_token(viewer_id)
+                runs = {
+                    "events (anonymous)": (EVENTS_QUERY, {"limit": size}, None),
+                    "events (viewer)": (EVENTS_QUERY, {"limit": size}, token),
+                    "events (viewer, plain)": (PLAIN_EVENTS_QUERY, {"limit": size}, token),
+                    "event (viewer)": (EVENT_QUERY, {"id": event_ids[size - 1]}, token),
+                    "myRegistrations": (MY_REGISTRATIONS_QUERY, None, token),
+                }
+                for name, (query, variables, run_token) in runs.items():
+                    event_listing_cache.clear()
+                    with track_queries(capture=True) as stats:
+                        body = await graphql(client, query, variables, run_token)
+                    assert not body.get("errors"), body["errors"]
+                    counts[name][size] = (stats.count, stats.statements)
+    finally:
+        # Pooled asyncpg connections belong to this event loop
+        await async_engine.dispose()
+    return counts
+
+@pytest.fixture(scope="module")
+def statement_counts():
+    run_id = uuid.uuid4().hex[:8]
+    event_ids, organizer_id, viewers = seed(run_id)
+    try:
+        yield run(measure_all(event_ids, viewers))
+    finally:
+        cleanup(event_ids, [organizer_id, *viewers.values()])
+
+@pytest.mark.parametrize("operation", list(EXPECTED))
+def test_statement_count_is_independent_of_result_size(statement_counts, operation):
+    by_size = statement_counts[operation]
+    counts = {size: count for size, (count, _) in by_size.items()}
+    statements = {
+        size: [" ".join(statement.split())[:160] for statement in captured]
+        for size, (_, captured) in by_size.items()
+    }
+    assert counts == {size: EXPECTED[operation] for size in SIZES}, statements
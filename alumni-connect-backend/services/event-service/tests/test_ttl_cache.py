@@ -0,0 +1,44 @@
+from app.cache.ttl_cache import TTLCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+    cache.set("a", 1)
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+def test_per_entry_ttl_overrides_default():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=60, clock=clock)
+    cache.set("short", 1, ttl=1)
+    clock.now = 2
+    assert cache.get("short", "missing") == "missing"
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+def test_delete_where_and_stats():
+    cache = TTLCache(maxsize=10, ttl=60)
+    for key in range(4):
+        cache.set(key, key * 10)
+    assert cache.delete_where(lambda key, value: value >= 20) == 2
+    cache.get(0)
+    cache.get(3)
+    assert cache.stats() == {"size": 2, "maxsize": 10, "hits": 1, "misses": 1}
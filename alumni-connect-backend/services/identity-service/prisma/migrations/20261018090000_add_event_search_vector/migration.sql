@@ -0,0 +1,9 @@
+-- AlterTable
+ALTER TABLE "identity_schema"."Event" ADD COLUMN     "searchVector" tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', coalesce("title", '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce("location", '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce("description", '')), 'C')
+) STORED;
+
+-- CreateIndex
+CREATE INDEX "Event_searchVector_idx" ON "identity_schema"."Event" USING GIN ("searchVector");
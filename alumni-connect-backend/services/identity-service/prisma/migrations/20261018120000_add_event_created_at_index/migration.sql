@@ -0,0 +1,2 @@
+-- CreateIndex
+CREATE INDEX "Event_createdAt_idx" ON "identity_schema"."Event"("createdAt");
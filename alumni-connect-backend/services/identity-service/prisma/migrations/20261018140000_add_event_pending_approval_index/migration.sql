@@ -0,0 +1,4 @@
+-- CreateIndex
+-- Partial index for the moderation queue. Prisma cannot express partial
+-- indexes in schema.prisma, so this one is only declared here.
+CREATE INDEX "Event_pendingApproval_createdAt_idx" ON "identity_schema"."Event"("createdAt", "id") WHERE "status" = 'PENDING_APPROVAL';
@@ -0,0 +1,13 @@
+-- AlterTable
+ALTER TABLE "identity_schema"."Event" ADD COLUMN     "attendedCount" INTEGER NOT NULL DEFAULT 0;
+
+-- Backfill from registrations already marked as attended
+UPDATE "identity_schema"."Event" e
+SET "attendedCount" = r.attended
+FROM (
+    SELECT "eventId", COUNT(*) AS attended
+    FROM "identity_schema"."Registration"
+    WHERE "status" = 'ATTENDED'
+    GROUP BY "eventId"
+) r
+WHERE r."eventId" = e."id";